@@ -6,7 +6,7 @@ from app.agents.skeptic import challenge_analysis
 from app.agents.judge import make_final_verdict
 from app.core.memory import memory
 from app.core.normalizer import Normalizer
-from app.services.correlator import correlate_logs
+from app.services.correlator import correlate_logs_async
 
 
 class WorkflowState:
@@ -57,7 +57,7 @@ async def execute_workflow(masked_log: str,
     # 3. Correlate (Log Correlation Skill)
     logging.info("Correlating with recent incidents...")
     recent_incidents = memory.get_recent_incidents(limit=5)
-    correlation_result = correlate_logs(normalized_json, recent_incidents)
+    correlation_result = await correlate_logs_async(normalized_json, recent_incidents)
     context_str += "LOG CORRELATION ANALYSIS:\n" + correlation_result + "\n\n"
 
     state = WorkflowState(masked_log, context_str, correlation_result)
@@ -17,6 +17,7 @@ class AgentState(BaseModel):
     alert_id: str = "unknown"
     masked_log: str = ""
     source: str = "splunk"
+    fingerprint: str = ""
     context: str = ""
     correlation: str = ""
     analyst_report: str = ""
@@ -91,8 +92,28 @@ class AgentSupervisor:
         normalized_log = Normalizer.to_ocsf(raw_log_dict, state.source)
         normalized_json = normalized_log.model_dump_json()
 
-        similar_incidents = memory.get_similar_cases(normalized_json)
-        company_docs = memory.get_company_docs(normalized_json)
+        # Correlation only needs the normalized log and recent incidents, so its
+        # LLM round-trip runs while the vector-store lookups are in flight.
+        async def _retrieve():
+            return await asyncio.gather(
+                asyncio.to_thread(memory.get_similar_cases, normalized_json),
+                asyncio.to_thread(memory.get_company_docs, normalized_json),
+            )
+
+        async def _correlate():
+            logger.info("[ENGINE] Step 2: CORRELATE - Cross-referencing incidents...")
+            recent_incidents = await asyncio.to_thread(
+                memory.get_recent_incidents, limit=5, tenant=tenant
+            )
+            return await self._call_tool(
+                "correlate_logs",
+                current_log=normalized_json,
+                recent_incidents=recent_incidents
+            )
+
+        (similar_incidents, company_docs), correlation_result = await asyncio.gather(
+            _retrieve(), _correlate()
+        )
 
         context_str = ""
         if similar_incidents:
@@ -104,12 +125,6 @@ class AgentSupervisor:
 
         # Step 2: CORRELATE
         state.step = "correlate"
-        logger.info("[ENGINE] Step 2: CORRELATE - Cross-referencing incidents...")
-        correlation_result = await self._call_tool(
-            "correlate_logs",
-            current_log=normalized_json,
-            recent_incidents=memory.get_recent_incidents(limit=5, tenant=tenant)
-        )
         state.correlation = str(correlation_result)
         state.context += "LOG CORRELATION ANALYSIS:\n" + state.correlation + "\n\n"
 
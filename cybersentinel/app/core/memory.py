@@ -26,9 +26,18 @@ class Incident(Base):
     risk_level = Column(String)
     category = Column(String)
     summary = Column(String)
+    fingerprint = Column(String, index=True, nullable=True)
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)
 
 
+# create_all() never alters an existing table, so columns added to the model
+# after first release are patched in at startup
+INCIDENT_SCHEMA_PATCHES = (
+    "ALTER TABLE incidents ADD COLUMN IF NOT EXISTS fingerprint VARCHAR",
+    "CREATE INDEX IF NOT EXISTS ix_incidents_fingerprint ON incidents (fingerprint)",
+)
+
+
 class Feedback(Base):
     __tablename__ = 'feedback'
     id = Column(Integer, primary_key=True)
@@ -69,6 +78,7 @@ class MemoryManager:
                 with self.engine.connect() as conn:
                     logger.info("Connected to PostgreSQL (Replit Managed)")
                 Base.metadata.create_all(self.engine)
+                self._patch_schema()
                 self.Session = sessionmaker(bind=self.engine)
                 self._db_available = True
             except Exception as e:
@@ -80,6 +90,14 @@ class MemoryManager:
             self._db_available = False
             self.Session = None
 
+    def _patch_schema(self):
+        try:
+            with self.engine.begin() as conn:
+                for ddl in INCIDENT_SCHEMA_PATCHES:
+                    conn.execute(text(ddl))
+        except Exception as e:
+            logger.error(f"Incident schema patch failed: {e}")
+
     def log_incident(self, alert_id: str, raw_log: str, source_type: str,
                      tenant: TenantContext = DEFAULT_TENANT):
         if not self.enabled or not self._db_available:
@@ -119,7 +137,8 @@ class MemoryManager:
             return [{
                 "alert_id": i.alert_id,
                 "raw_log": i.raw_log,
-                "source_type": i.source_type
+                "source_type": i.source_type,
+                "fingerprint": i.fingerprint
             } for i in incidents]
         except Exception as e:
             logger.error(f"Error getting recent incidents: {e}")
@@ -218,6 +237,8 @@ class MemoryManager:
                 existing_incident.category = analysis.get('category', 'General')
                 existing_incident.summary = analysis.get('summary', 'No summary')
                 existing_incident.raw_log = raw_log
+                if analysis.get('fingerprint'):
+                    existing_incident.fingerprint = analysis['fingerprint']
             else:
                 new_incident = Incident(
                     alert_id=target_id,
@@ -227,7 +248,8 @@ class MemoryManager:
                     risk_level=analysis.get('risk_level', 'Pending'),
                     category=analysis.get('category', 'General'),
                     summary=analysis.get('summary', 'No summary'),
-                    source_type=analysis.get('source_type', 'unknown'))
+                    source_type=analysis.get('source_type', 'unknown'),
+                    fingerprint=analysis.get('fingerprint'))
                 session.add(new_incident)
 
             session.commit()
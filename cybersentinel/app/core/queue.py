@@ -144,22 +144,30 @@ class TaskQueue:
             )
 
     async def enqueue(self, coro) -> str:
+        """
+        Enqueue a coroutine without blocking the producer.
+
+        When the queue is at max_queue_size the task is recorded as REJECTED
+        and the coroutine is closed; callers should surface this as
+        backpressure (e.g. HTTP 429) rather than waiting for a free slot.
+        """
         await self._ensure_started()
 
-        if self._queue.full():
-            task_id = f"task-{uuid.uuid4().hex[:8]}"
-            task = TaskResult(task_id)
+        task_id = f"task-{uuid.uuid4().hex[:8]}"
+        task = TaskResult(task_id)
+        self._tasks[task_id] = task
+
+        try:
+            self._queue.put_nowait((task_id, coro))
+        except asyncio.QueueFull:
+            coro.close()
             task.status = TaskStatus.REJECTED
             task.error = "Queue is full. Try again later."
             task.completed_at = time.time()
-            self._tasks[task_id] = task
             self._metrics["rejected_count"] += 1
             logger.warning(f"[QUEUE] REJECTED task {task_id}: queue full ({self._max_queue_size})")
             return task_id
 
-        task_id = f"task-{uuid.uuid4().hex[:8]}"
-        self._tasks[task_id] = TaskResult(task_id)
-        await self._queue.put((task_id, coro))
         logger.info(f"[QUEUE] Enqueued {task_id}. Pending: {self._queue.qsize()}/{self._max_queue_size}")
         return task_id
 
@@ -1,4 +1,6 @@
 import asyncio
+import itertools
+import threading
 import time
 import logging
 from typing import Callable, Optional, Type, Tuple
@@ -36,6 +38,11 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self._state = self.STATE_CLOSED
         self._failure_count = 0
+        # next() on itertools.count is atomic under the GIL, so concurrent
+        # record_failure() calls never lose an increment; _failure_count keeps
+        # the last value observed for reporting.
+        self._failures = itertools.count(1)
+        self._trip_lock = threading.Lock()
         self._last_failure_time: Optional[float] = None
         self._success_count = 0
 
@@ -49,6 +56,7 @@ class CircuitBreaker:
         return self._state
 
     def record_success(self):
+        self._failures = itertools.count(1)
         self._failure_count = 0
         self._success_count += 1
         if self._state == self.STATE_HALF_OPEN:
@@ -56,13 +64,20 @@ class CircuitBreaker:
             logger.info(f"[CIRCUIT-BREAKER:{self.name}] Circuit CLOSED after successful probe")
 
     def record_failure(self):
-        self._failure_count += 1
+        failures = next(self._failures)
+        self._failure_count = failures
         self._last_failure_time = time.time()
-        if self._failure_count >= self.failure_threshold:
+        if failures >= self.failure_threshold:
+            self._trip(failures)
+
+    def _trip(self, failures: int):
+        with self._trip_lock:
+            if self._state == self.STATE_OPEN:
+                return
             self._state = self.STATE_OPEN
-            logger.warning(
-                f"[CIRCUIT-BREAKER:{self.name}] Circuit OPEN after {self._failure_count} failures"
-            )
+        logger.warning(
+            f"[CIRCUIT-BREAKER:{self.name}] Circuit OPEN after {failures} failures"
+        )
 
     def allow_request(self) -> bool:
         current = self.state
@@ -72,6 +87,10 @@ class CircuitBreaker:
             return True
         return False
 
+    def snapshot(self) -> Tuple[str, int]:
+        """(state, failure_count) without building the full status dict."""
+        return self.state, self._failure_count
+
     def get_status(self) -> dict:
         return {
             "name": self.name,
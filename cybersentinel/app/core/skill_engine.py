@@ -2,6 +2,7 @@ import os
 import logging
 import importlib.util
 from pathlib import Path
+from types import ModuleType
 from typing import Dict, Any, Optional
 from langchain_groq import ChatGroq
 from app.core.config import settings
@@ -22,6 +23,7 @@ class SkillEngine:
 
     def __init__(self):
         self._skills: Dict[str, dict] = {}
+        self._modules: Dict[str, ModuleType] = {}
         os.makedirs(SKILLS_DIR, exist_ok=True)
         init_file = SKILLS_DIR / "__init__.py"
         if not init_file.exists():
@@ -44,6 +46,14 @@ class SkillEngine:
     def list_skills(self) -> list:
         return list(self._skills.values())
 
+    def get_module(self, name: str) -> Optional[ModuleType]:
+        """Return the loaded module for a skill, hot-loading a discovered one on first use."""
+        module = self._modules.get(name)
+        if module is None and name in self._skills:
+            self._hot_load(name, Path(self._skills[name]["file"]))
+            module = self._modules.get(name)
+        return module
+
     def generate_skill(self, name: str, description: str) -> dict:
         """
         Use the AI to generate a new skill based on a description,
@@ -112,6 +122,7 @@ Output ONLY the Python code, no markdown formatting or explanation.
             if spec and spec.loader:
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
+                self._modules[name] = module
                 self._skills[name]["status"] = "loaded"
                 logger.info(f"[SKILL-ENGINE] Hot-loaded: {name}")
         except Exception as e:
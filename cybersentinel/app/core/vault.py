@@ -30,6 +30,7 @@ class SecretVault:
 
     MAX_VAULT_ENTRIES = 50000
     MAX_AUDIT_ENTRIES = 10000
+    AUDIT_FIELDS = ("timestamp", "action", "token", "type", "reason")
 
     def __init__(self):
         self._vault: OrderedDict[str, dict] = OrderedDict()
@@ -128,6 +129,15 @@ class SecretVault:
     def get_audit_log(self) -> list:
         return list(self._audit_log)
 
+    def get_audit_log_columns(self) -> Dict[str, list]:
+        """Audit log as one list per field, built in a single pass over a snapshot."""
+        columns = {field: [] for field in self.AUDIT_FIELDS}
+        appenders = [(field, columns[field].append) for field in self.AUDIT_FIELDS]
+        for entry in self._audit_log:
+            for field, append in appenders:
+                append(entry.get(field))
+        return columns
+
     @property
     def audit_log_count(self) -> int:
         return len(self._audit_log)
@@ -27,6 +27,10 @@ class MultiChannelGateway:
             return True
         return False
 
+    @property
+    def has_gateways(self) -> bool:
+        return bool(self._gateways)
+
     def get_gateway(self, name: str) -> Optional[BaseGateway]:
         return self._gateways.get(name)
 
@@ -1,6 +1,8 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import asyncio
+import hashlib
 import logging
 import io
 import re
@@ -10,9 +12,10 @@ import time
 import resource
 
 try:
-    import PyPDF2
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
 except ImportError:
-    PyPDF2 = None
+    from fastapi.responses import JSONResponse as DefaultResponse
 
 from app.core.config import settings, dynamic_settings
 from app.core.dynamic_settings import get_dynamic_settings
@@ -29,7 +32,7 @@ from app.plugins.ticketing import TicketingManager
 from app.core.security import get_api_key
 from app.core.resilience import get_circuit_breaker
 
-from app.tools.log_correlator import correlate_logs_tool
+from app.tools.log_correlator import correlate_logs_tool_async
 from app.tools.analyst_tool import analyze_log_tool
 from app.tools.skeptic_tool import challenge_analysis_tool
 from app.tools.judge_tool import make_verdict_tool
@@ -41,13 +44,10 @@ from app.core.skill_engine import skill_engine
 from app.core.scheduler import scheduler
 
 from app.gateways import MultiChannelGateway
-from app.gateways.telegram import TelegramGateway
-from app.gateways.discord import DiscordGateway
-from app.gateways.slack import SlackGateway
 
-from config.infra_adapter import Infra
-from app.providers.model_provider import list_providers, get_model_provider
-from app.providers.integration_hub import IntegrationHub
+from config.infra_adapter import get_infra
+from app.providers.model_provider import list_providers, list_providers_with_health, get_model_provider
+from app.providers.integration_hub import IntegrationHub, close_async_http
 from app.providers.social_connector import list_social_connectors
 
 from fastapi.middleware.cors import CORSMiddleware
@@ -60,9 +60,14 @@ logger = logging.getLogger(__name__)
 
 _start_time = time.time()
 
+_STATUS_CACHE_TTL = 1.0
+_health_cache: Dict[str, Any] = {"t": 0.0, "payload": None}
+_infra_status_cache: Dict[str, Any] = {"t": 0.0, "payload": None}
+
 app = FastAPI(title="CyberSentinel AI - Autonomous Agentic SOC",
               description="AI-Native Self-Learning Security Operations Center",
-              version="1.0.0")
+              version="1.0.0",
+              default_response_class=DefaultResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -126,15 +131,30 @@ multi_channel_gateway = MultiChannelGateway()
 integration_hub = IntegrationHub()
 
 
+_IP_RE = re.compile(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}')
+_NUM_RE = re.compile(r'\d+')
+_PUNCT_TBL = str.maketrans('', '', string.punctuation)
+_FAST_PATH_MAX_LEN = 128
+
+
 def get_log_fingerprint(text: str) -> str:
     if not text:
         return ""
-    text = re.sub(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', '[IP]', text)
-    text = re.sub(r'\d+', '', text)
-    text = text.translate(str.maketrans('', '', string.punctuation))
+    # Short logs without digits cannot contain an IP or number, so the
+    # regex passes would be no-ops.
+    if len(text) >= _FAST_PATH_MAX_LEN or any(ch.isdigit() for ch in text):
+        text = _IP_RE.sub('[IP]', text)
+        text = _NUM_RE.sub('', text)
+    text = text.translate(_PUNCT_TBL)
     return " ".join(text.lower().split())
 
 
+def get_log_fingerprint_digest(text: str) -> str:
+    """Digest of get_log_fingerprint(); the fingerprint keeps unmasked text, so only this is stored."""
+    return hashlib.blake2b(get_log_fingerprint(text).encode(),
+                           digest_size=16).hexdigest()
+
+
 @app.on_event("startup")
 async def startup_event():
     global ticketing_manager
@@ -154,7 +174,7 @@ async def startup_event():
     ticketing_manager = TicketingManager()
     logger.info("[STARTUP] Ticketing manager initialized")
 
-    supervisor.register_tool("correlate_logs", correlate_logs_tool)
+    supervisor.register_tool("correlate_logs", correlate_logs_tool_async)
     supervisor.register_tool("analyze_log", analyze_log_tool)
     supervisor.register_tool("challenge_analysis", challenge_analysis_tool)
     supervisor.register_tool("make_verdict", make_verdict_tool)
@@ -169,16 +189,19 @@ async def startup_event():
 
     if settings.enable_social_gateway:
         if settings.telegram_bot_token:
+            from app.gateways.telegram import TelegramGateway
             tg = TelegramGateway()
             multi_channel_gateway.register(tg)
             logger.info("[STARTUP] Telegram gateway registered")
 
         if settings.discord_webhook_url:
+            from app.gateways.discord import DiscordGateway
             dc = DiscordGateway()
             multi_channel_gateway.register(dc)
             logger.info("[STARTUP] Discord gateway registered")
 
         if settings.slack_webhook_url:
+            from app.gateways.slack import SlackGateway
             sl = SlackGateway()
             multi_channel_gateway.register(sl)
             logger.info("[STARTUP] Slack gateway registered")
@@ -193,6 +216,12 @@ async def startup_event():
     logger.info("[STARTUP] CyberSentinel AI v1.0.0 ready.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_async_http()
+    await get_infra().aclose()
+
+
 @app.get("/")
 async def root():
     return {
@@ -203,13 +232,17 @@ async def root():
     }
 
 
-async def _process_alert(webhook: AlertWebhook) -> Dict[str, Any]:
+async def _process_alert(webhook: AlertWebhook,
+                         fingerprint: Optional[str] = None) -> Dict[str, Any]:
     tenant = TenantContext(user_id=webhook.user_id, org_id=webhook.org_id)
     masked_log = mask_pii(webhook.raw_data)
 
     state = AgentState(alert_id=webhook.alert_id,
                        masked_log=masked_log,
-                       source=webhook.source or "splunk")
+                       source=webhook.source or "splunk",
+                       fingerprint=fingerprint
+                       if fingerprint is not None else
+                       get_log_fingerprint_digest(webhook.raw_data))
 
     final_state = await supervisor.run(state, tenant)
 
@@ -217,52 +250,59 @@ async def _process_alert(webhook: AlertWebhook) -> Dict[str, Any]:
     if final_state.verdict == "False Positive":
         risk_level = "Low"
 
-    try:
-        memory.save_incident(raw_log=masked_log,
-                             analysis={
-                                 "alert_id":
-                                 webhook.alert_id,
-                                 "risk_level":
-                                 risk_level,
-                                 "category":
-                                 "General",
-                                 "summary":
-                                 final_state.remediation[:200]
-                                 if final_state.remediation else "Analyzed",
-                                 "source_type":
-                                 webhook.source
-                             },
-                             tenant=tenant)
-    except Exception as db_err:
-        logger.error(f"Database save failed: {db_err}")
-
-    plugin_loader.notify_all(
-        "alert_analyzed", {
-            "alert_id": webhook.alert_id,
-            "verdict": final_state.verdict,
-            "risk_level": risk_level
+    side_effects = {
+        "Database save":
+        asyncio.to_thread(memory.save_incident,
+                          raw_log=masked_log,
+                          analysis={
+                              "alert_id":
+                              webhook.alert_id,
+                              "risk_level":
+                              risk_level,
+                              "category":
+                              "General",
+                              "summary":
+                              final_state.remediation[:200]
+                              if final_state.remediation else "Analyzed",
+                              "source_type":
+                              webhook.source,
+                              "fingerprint":
+                              final_state.fingerprint
+                          },
+                          tenant=tenant),
+        "Plugin notify":
+        asyncio.to_thread(
+            plugin_loader.notify_all, "alert_analyzed", {
+                "alert_id": webhook.alert_id,
+                "verdict": final_state.verdict,
+                "risk_level": risk_level
+            }),
+    }
+
+    if multi_channel_gateway.has_gateways and (
+            risk_level in ("High", "Critical") or
+        (webhook.risk_score and webhook.risk_score > 75)):
+        side_effects["Gateway broadcast"] = multi_channel_gateway.broadcast_alert({
+            "title":
+            f"Alert {webhook.alert_id}",
+            "severity":
+            risk_level.lower(),
+            "description":
+            webhook.description,
+            "source":
+            webhook.source,
+            "timestamp":
+            webhook.timestamp or time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "iocs": [],
+            "recommended_actions": [final_state.remediation[:200]]
+            if final_state.remediation else [],
         })
 
-    if risk_level in ("High", "Critical") or (webhook.risk_score
-                                              and webhook.risk_score > 75):
-        try:
-            await multi_channel_gateway.broadcast_alert({
-                "title":
-                f"Alert {webhook.alert_id}",
-                "severity":
-                risk_level.lower(),
-                "description":
-                webhook.description,
-                "source":
-                webhook.source,
-                "timestamp":
-                webhook.timestamp or time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "iocs": [],
-                "recommended_actions": [final_state.remediation[:200]]
-                if final_state.remediation else [],
-            })
-        except Exception as gw_err:
-            logger.error(f"Gateway broadcast failed: {gw_err}")
+    outcomes = await asyncio.gather(*side_effects.values(),
+                                    return_exceptions=True)
+    for label, outcome in zip(side_effects, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"{label} failed: {outcome}")
 
     return {
         "alert_id": webhook.alert_id,
@@ -283,12 +323,14 @@ async def _process_alert(webhook: AlertWebhook) -> Dict[str, Any]:
           dependencies=[Depends(get_api_key)])
 async def ingest_alert(webhook: AlertWebhook):
     try:
-        current_fp = get_log_fingerprint(webhook.raw_data)
+        current_fp = get_log_fingerprint_digest(webhook.raw_data)
         tenant = TenantContext(user_id=webhook.user_id, org_id=webhook.org_id)
         recent_cases = memory.get_recent_incidents(limit=50, tenant=tenant)
 
         for case in recent_cases:
-            if get_log_fingerprint(case.get('raw_log', '')) == current_fp:
+            case_fp = case.get('fingerprint') or get_log_fingerprint_digest(
+                case.get('raw_log', ''))
+            if case_fp == current_fp:
                 return IngestResponse(
                     alert_id=webhook.alert_id,
                     task_id="duplicate",
@@ -297,7 +339,11 @@ async def ingest_alert(webhook: AlertWebhook):
                     "Identical attack pattern detected. Skipping to prevent DB spam."
                 )
 
-        task_id = await task_queue.enqueue(_process_alert(webhook))
+        task_id = await task_queue.enqueue(
+            _process_alert(webhook, fingerprint=current_fp))
+        task = task_queue.get_status(task_id)
+        if task and task.status == TaskStatus.REJECTED:
+            raise HTTPException(status_code=429, detail="Ingest queue full")
 
         return IngestResponse(
             alert_id=webhook.alert_id,
@@ -306,6 +352,8 @@ async def ingest_alert(webhook: AlertWebhook):
             message=
             "Alert queued for analysis. Poll /v1/task/{task_id} for results.")
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Ingest error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -349,15 +397,16 @@ async def analyze_alert(webhook: AlertWebhook):
             "correlation": result.get("correlation", "")
         }
 
-        executive_report = generate_executive_report(verdict=result["verdict"],
-                                                     alert_data=alert_data,
-                                                     reasoning=reasoning)
-
-        technical_report = generate_technical_report(verdict=result["verdict"],
-                                                     alert_data=alert_data,
-                                                     reasoning=reasoning,
-                                                     playbook_refs=result.get(
-                                                         "playbook_refs", []))
+        executive_report, technical_report = await asyncio.gather(
+            asyncio.to_thread(generate_executive_report,
+                              verdict=result["verdict"],
+                              alert_data=alert_data,
+                              reasoning=reasoning),
+            asyncio.to_thread(generate_technical_report,
+                              verdict=result["verdict"],
+                              alert_data=alert_data,
+                              reasoning=reasoning,
+                              playbook_refs=result.get("playbook_refs", [])))
 
         report_payload = {
             "alert_id": webhook.alert_id,
@@ -411,7 +460,9 @@ async def upload_knowledge(file: UploadFile = File(...),
     try:
         content = ""
         if file.filename.endswith(".pdf"):
-            if not PyPDF2:
+            try:
+                import PyPDF2
+            except ImportError:
                 raise Exception("PyPDF2 is not installed.")
             pdf_reader = PyPDF2.PdfReader(io.BytesIO(await file.read()))
             for page in pdf_reader.pages:
@@ -439,7 +490,11 @@ async def vault_audit():
 
 @app.get("/health")
 async def health_check():
-    return {
+    now = time.monotonic()
+    if _health_cache["payload"] and now - _health_cache["t"] < _STATUS_CACHE_TTL:
+        return _health_cache["payload"]
+
+    payload = {
         "status":
         "healthy",
         "version":
@@ -465,9 +520,14 @@ async def health_check():
         memory.enabled,
         "queue_workers":
         task_queue._max_workers,
+        "queue_depth":
+        task_queue.pending_count,
         "gateways":
         multi_channel_gateway.get_status(),
     }
+    _health_cache["t"] = now
+    _health_cache["payload"] = payload
+    return payload
 
 
 @app.get("/v1/health/pro", dependencies=[Depends(get_api_key)])
@@ -528,7 +588,14 @@ async def health_pro():
 
 @app.get("/v1/infra/status")
 async def infra_status():
-    return Infra.get_config()
+    now = time.monotonic()
+    if _infra_status_cache["payload"] and now - _infra_status_cache["t"] < _STATUS_CACHE_TTL:
+        return _infra_status_cache["payload"]
+
+    payload = get_infra().get_config()
+    _infra_status_cache["t"] = now
+    _infra_status_cache["payload"] = payload
+    return payload
 
 
 @app.get("/v1/gateways/status")
@@ -739,7 +806,9 @@ async def complete_onboarding():
 
 
 @app.get("/v1/providers/models")
-async def get_model_providers():
+async def get_model_providers(health: bool = False):
+    if health:
+        return await list_providers_with_health()
     return list_providers()
 
 
@@ -756,6 +825,12 @@ async def test_integration(data: Dict[str, Any] = {}):
     return result
 
 
+@app.post("/v1/providers/integrations/test-all",
+          dependencies=[Depends(get_api_key)])
+async def test_all_integrations():
+    return await integration_hub.test_all_async()
+
+
 @app.get("/v1/providers/social")
 async def get_social_connectors():
     return list_social_connectors()
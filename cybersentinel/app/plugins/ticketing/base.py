@@ -1,5 +1,28 @@
+import requests
 from abc import ABC, abstractmethod
 from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_http_session() -> requests.Session:
+    """
+    Shared keep-alive session for plugins that call out over HTTP.
+    Only connection failures are retried: ticket creation is a POST, and
+    replaying it after a 5xx could open duplicate tickets.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32,
+                          pool_maxsize=32,
+                          max_retries=Retry(total=2, connect=2, read=0,
+                                            status=0, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+http_session = _build_http_session()
+
 
 class TicketingPlugin(ABC):
     """
@@ -1,31 +1,34 @@
-import requests
 import logging
 from typing import Dict, Any
-from .base import TicketingPlugin
+from .base import TicketingPlugin, http_session
 from ...core.config import settings
 
 class JiraPlugin(TicketingPlugin):
     """
     Jira Plugin for creating Jira issues.
     """
-    
+
+    def __init__(self):
+        self.jira_url = settings.jira_url
+        self.jira_token = settings.jira_token
+
     def create_ticket(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
         summary = f"[CyberSentinel] {report_data.get('alert_id', 'Unknown')} - {report_data.get('verdict', 'Unknown')}"
         description = report_data.get('technical_report', 'No description available')[:1000]
         
-        if settings.jira_token == "mock" or not settings.jira_url or settings.jira_url.startswith("https://mock-jira"):
+        if self.jira_token == "mock" or not self.jira_url or self.jira_url.startswith("https://mock-jira"):
             logging.info("[Mock Mode] Jira ticket creation.")
             return {
                 "ticket_id": "MOCK-12345",
                 "summary": summary,
                 "status": "created_mock",
-                "url": f"{settings.jira_url}/browse/MOCK-12345",
+                "url": f"{self.jira_url}/browse/MOCK-12345",
                 "plugin": "jira"
             }
         
         try:
             headers = {
-                "Authorization": f"Bearer {settings.jira_token}",
+                "Authorization": f"Bearer {self.jira_token}",
                 "Content-Type": "application/json"
             }
             
@@ -38,8 +41,8 @@ class JiraPlugin(TicketingPlugin):
                 }
             }
             
-            response = requests.post(
-                f"{settings.jira_url}/rest/api/2/issue",
+            response = http_session.post(
+                f"{self.jira_url}/rest/api/2/issue",
                 headers=headers,
                 json=payload,
                 timeout=10
@@ -50,7 +53,7 @@ class JiraPlugin(TicketingPlugin):
             return {
                 "ticket_id": data.get("key"),
                 "status": "created",
-                "url": f"{settings.jira_url}/browse/{data.get('key')}",
+                "url": f"{self.jira_url}/browse/{data.get('key')}",
                 "plugin": "jira"
             }
         except Exception as e:
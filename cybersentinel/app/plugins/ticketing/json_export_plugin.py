@@ -12,13 +12,14 @@ class JsonExportPlugin(TicketingPlugin):
     JSON Export Plugin.
     Saves the analysis report to a local JSON file. Useful for air-gapped environments.
     """
-    
+
+    def __init__(self):
+        base_dir = Path(__file__).parent.parent.parent.parent
+        self.export_dir = base_dir / settings.ticket_export_path
+
     def create_ticket(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
-        export_path = settings.ticket_export_path
-        
         # Ensure the directory exists
-        base_dir = Path(__file__).parent.parent.parent.parent
-        full_export_path = base_dir / export_path
+        full_export_path = self.export_dir
         os.makedirs(full_export_path, exist_ok=True)
         
         # Generate filename based on alert ID and timestamp
@@ -1,7 +1,6 @@
-import requests
 import logging
 from typing import Dict, Any
-from .base import TicketingPlugin
+from .base import TicketingPlugin, http_session
 from ...core.config import settings
 
 class WebhookPlugin(TicketingPlugin):
@@ -9,9 +8,12 @@ class WebhookPlugin(TicketingPlugin):
     Universal Webhook Plugin.
     Sends the analysis report as a JSON payload to a specified URL.
     """
-    
+
+    def __init__(self):
+        self.webhook_url = settings.ticket_webhook_url
+
     def create_ticket(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
-        webhook_url = settings.ticket_webhook_url
+        webhook_url = self.webhook_url
         
         # Mock mode fallback if no real URL is configured
         if not webhook_url or webhook_url.startswith("https://mock-webhook"):
@@ -25,7 +27,7 @@ class WebhookPlugin(TicketingPlugin):
             
         try:
             logging.info(f"Sending webhook to {webhook_url}")
-            response = requests.post(
+            response = http_session.post(
                 webhook_url,
                 json=report_data,
                 timeout=10
@@ -1,9 +1,78 @@
+import asyncio
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Dict, Any, List, Optional, Tuple, Type
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from app.core.config import settings
+except Exception:
+    settings = None
 
 logger = logging.getLogger(__name__)
 
+PROBE_TIMEOUT: Tuple[float, float] = (2, 3)
+
+
+def _build_http_session() -> requests.Session:
+    """
+    Keep-alive session shared by every status probe so polling reuses TLS sockets.
+    Probes never retry: a health check should report failure fast, not mask it.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16,
+                          pool_maxsize=16,
+                          max_retries=Retry(total=0, connect=0, read=0))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_HTTP = _build_http_session()
+
+
+_ASYNC_HTTP: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_http() -> httpx.AsyncClient:
+    global _ASYNC_HTTP
+    if _ASYNC_HTTP is None or _ASYNC_HTTP.is_closed:
+        _ASYNC_HTTP = httpx.AsyncClient(
+            timeout=httpx.Timeout(PROBE_TIMEOUT[1], connect=PROBE_TIMEOUT[0]),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _ASYNC_HTTP
+
+
+async def close_async_http() -> None:
+    """Close the shared async probe client (called from app shutdown)."""
+    global _ASYNC_HTTP
+    if _ASYNC_HTTP is not None:
+        await _ASYNC_HTTP.aclose()
+        _ASYNC_HTTP = None
+
+
+async def async_http_probe(url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """Non-blocking counterpart of http_probe() on the shared httpx client."""
+    response = await _get_async_http().get(url, headers=headers or {})
+    response.raise_for_status()
+    return response
+
+
+def http_probe(url: str, headers: Optional[Dict[str, str]] = None,
+               timeout: Tuple[float, float] = PROBE_TIMEOUT) -> requests.Response:
+    """GET `url` over the shared session; raises on connection errors and 4xx/5xx."""
+    response = _HTTP.get(url, headers=headers or {}, timeout=timeout)
+    response.raise_for_status()
+    return response
+
 
 class BaseIntegration(ABC):
     """Abstract base class for all external integrations."""
@@ -34,6 +103,14 @@ class BaseIntegration(ABC):
             "configured": self.is_configured(),
         }
 
+    async def test_connection_async(self) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.test_connection)
+
+    def _http_probe(self, url: str, headers: Optional[Dict[str, str]] = None,
+                    timeout: Tuple[float, float] = PROBE_TIMEOUT) -> requests.Response:
+        return http_probe(url, headers=headers, timeout=timeout)
+
 
 class SplunkIntegration(BaseIntegration):
     """Splunk SIEM integration wrapping existing splunk_client."""
@@ -43,13 +120,8 @@ class SplunkIntegration(BaseIntegration):
     category = "siem"
 
     def __init__(self):
-        try:
-            from app.core.config import settings
-            self._url = settings.splunk_url
-            self._token = settings.splunk_token
-        except Exception:
-            self._url = ""
-            self._token = ""
+        self._url = getattr(settings, "splunk_url", "") or ""
+        self._token = getattr(settings, "splunk_token", "") or ""
 
     def is_configured(self) -> bool:
         return bool(
@@ -63,14 +135,23 @@ class SplunkIntegration(BaseIntegration):
         if not self.is_configured():
             return {"success": False, "message": "Splunk not configured"}
         try:
-            import urllib.request
-            req = urllib.request.Request(
+            self._http_probe(
+                f"{self._url}/services/server/info",
+                headers={"Authorization": f"Bearer {self._token}"},
+            )
+            return {"success": True, "message": "Splunk connection successful"}
+        except Exception as e:
+            return {"success": False, "message": f"Splunk connection failed: {str(e)}"}
+
+    async def test_connection_async(self) -> Dict[str, Any]:
+        if not self.is_configured():
+            return {"success": False, "message": "Splunk not configured"}
+        try:
+            await async_http_probe(
                 f"{self._url}/services/server/info",
                 headers={"Authorization": f"Bearer {self._token}"},
-                method="GET",
             )
-            with urllib.request.urlopen(req, timeout=5):
-                return {"success": True, "message": "Splunk connection successful"}
+            return {"success": True, "message": "Splunk connection successful"}
         except Exception as e:
             return {"success": False, "message": f"Splunk connection failed: {str(e)}"}
 
@@ -83,13 +164,8 @@ class JiraIntegration(BaseIntegration):
     category = "ticketing"
 
     def __init__(self):
-        try:
-            from app.core.config import settings
-            self._url = settings.jira_url
-            self._token = settings.jira_token
-        except Exception:
-            self._url = ""
-            self._token = ""
+        self._url = getattr(settings, "jira_url", "") or ""
+        self._token = getattr(settings, "jira_token", "") or ""
 
     def is_configured(self) -> bool:
         return bool(
@@ -103,14 +179,23 @@ class JiraIntegration(BaseIntegration):
         if not self.is_configured():
             return {"success": False, "message": "Jira not configured"}
         try:
-            import urllib.request
-            req = urllib.request.Request(
+            self._http_probe(
                 f"{self._url}/rest/api/2/serverInfo",
                 headers={"Authorization": f"Bearer {self._token}"},
-                method="GET",
             )
-            with urllib.request.urlopen(req, timeout=5):
-                return {"success": True, "message": "Jira connection successful"}
+            return {"success": True, "message": "Jira connection successful"}
+        except Exception as e:
+            return {"success": False, "message": f"Jira connection failed: {str(e)}"}
+
+    async def test_connection_async(self) -> Dict[str, Any]:
+        if not self.is_configured():
+            return {"success": False, "message": "Jira not configured"}
+        try:
+            await async_http_probe(
+                f"{self._url}/rest/api/2/serverInfo",
+                headers={"Authorization": f"Bearer {self._token}"},
+            )
+            return {"success": True, "message": "Jira connection successful"}
         except Exception as e:
             return {"success": False, "message": f"Jira connection failed: {str(e)}"}
 
@@ -123,11 +208,7 @@ class VirusTotalIntegration(BaseIntegration):
     category = "threat_intel"
 
     def __init__(self):
-        try:
-            from app.core.config import settings
-            self._api_key = settings.vt_api_key
-        except Exception:
-            self._api_key = ""
+        self._api_key = getattr(settings, "vt_api_key", "") or ""
 
     def is_configured(self) -> bool:
         return bool(self._api_key and self._api_key != "mock" and len(self._api_key) > 5)
@@ -136,14 +217,23 @@ class VirusTotalIntegration(BaseIntegration):
         if not self.is_configured():
             return {"success": False, "message": "VirusTotal not configured"}
         try:
-            import urllib.request
-            req = urllib.request.Request(
+            self._http_probe(
+                "https://www.virustotal.com/api/v3/ip_addresses/8.8.8.8",
+                headers={"x-apikey": self._api_key},
+            )
+            return {"success": True, "message": "VirusTotal connection successful"}
+        except Exception as e:
+            return {"success": False, "message": f"VirusTotal connection failed: {str(e)}"}
+
+    async def test_connection_async(self) -> Dict[str, Any]:
+        if not self.is_configured():
+            return {"success": False, "message": "VirusTotal not configured"}
+        try:
+            await async_http_probe(
                 "https://www.virustotal.com/api/v3/ip_addresses/8.8.8.8",
                 headers={"x-apikey": self._api_key},
-                method="GET",
             )
-            with urllib.request.urlopen(req, timeout=10):
-                return {"success": True, "message": "VirusTotal connection successful"}
+            return {"success": True, "message": "VirusTotal connection successful"}
         except Exception as e:
             return {"success": False, "message": f"VirusTotal connection failed: {str(e)}"}
 
@@ -208,8 +298,16 @@ class HybridAnalysisIntegration(BaseIntegration):
 class IntegrationHub:
     """Registry that lists all integrations, their status, and allows testing."""
 
+    TEST_ALL_BUDGET_SECONDS = 12.0
+    TEST_TIMEOUT_SECONDS = 5.0
+    STATUS_CACHE_TTL = 5.0
+
     def __init__(self):
+        self._integration_classes: Dict[str, Type[BaseIntegration]] = {}
         self._integrations: Dict[str, BaseIntegration] = {}
+        self._instance_lock = threading.Lock()
+        self._status_cache: Dict[str, Any] = {"t": 0.0, "payload": None}
+        self._status_lock = threading.Lock()
         self._register_defaults()
 
     def _register_defaults(self):
@@ -221,24 +319,43 @@ class IntegrationHub:
             NotionIntegration,
             HybridAnalysisIntegration,
         ]:
-            try:
-                instance = cls()
-                self._integrations[instance.name] = instance
-            except Exception as e:
-                logger.error(f"[HUB] Failed to register {cls.__name__}: {e}")
+            self._integration_classes[cls.name] = cls
 
     def register(self, integration: BaseIntegration) -> None:
         self._integrations[integration.name] = integration
+        self._integration_classes[integration.name] = type(integration)
+        self._status_cache["payload"] = None
         logger.info(f"[HUB] Registered integration: {integration.display_name}")
 
     def get(self, name: str) -> BaseIntegration:
         integration = self._integrations.get(name)
-        if not integration:
+        if integration:
+            return integration
+        cls = self._integration_classes.get(name)
+        if not cls:
             raise ValueError(f"Unknown integration: {name}")
+        with self._instance_lock:
+            integration = self._integrations.get(name)
+            if not integration:
+                integration = cls()
+                self._integrations[name] = integration
         return integration
 
     def list_all(self) -> List[Dict[str, Any]]:
-        return [integ.get_status() for integ in self._integrations.values()]
+        results = []
+        for name, cls in self._integration_classes.items():
+            try:
+                results.append(self.get(name).get_status())
+            except Exception as e:
+                logger.error(f"[HUB] Failed to load {cls.__name__}: {e}")
+        return results
+
+    def list_metadata(self) -> List[Dict[str, Any]]:
+        """Static name/display_name/category listing; does not instantiate integrations."""
+        return [
+            {"name": cls.name, "display_name": cls.display_name, "category": cls.category}
+            for cls in self._integration_classes.values()
+        ]
 
     def test_integration(self, name: str) -> Dict[str, Any]:
         try:
@@ -252,6 +369,17 @@ class IntegrationHub:
             return {"success": False, "message": f"Test failed: {str(e)}", "integration": name}
 
     def get_status(self) -> Dict[str, Any]:
+        cache = self._status_cache
+        if cache["payload"] is not None and time.monotonic() - cache["t"] < self.STATUS_CACHE_TTL:
+            return cache["payload"]
+        with self._status_lock:
+            if cache["payload"] is not None and time.monotonic() - cache["t"] < self.STATUS_CACHE_TTL:
+                return cache["payload"]
+            cache["payload"] = self._collect_status()
+            cache["t"] = time.monotonic()
+            return cache["payload"]
+
+    def _collect_status(self) -> Dict[str, Any]:
         all_integrations = self.list_all()
         configured_count = sum(1 for i in all_integrations if i.get("configured"))
         return {
@@ -259,3 +387,54 @@ class IntegrationHub:
             "configured": configured_count,
             "integrations": all_integrations,
         }
+
+    def test_all(self, timeout: float = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Test every registered integration concurrently.
+        Total wall time is bounded by `timeout` (max-of-checks, not sum);
+        integrations that have not answered by then are reported as timed out.
+        """
+        budget = timeout if timeout is not None else self.TEST_ALL_BUDGET_SECONDS
+        results: Dict[str, Dict[str, Any]] = {}
+        if not self._integration_classes:
+            return results
+
+        executor = ThreadPoolExecutor(max_workers=len(self._integration_classes),
+                                      thread_name_prefix="integration-test")
+        futures = {
+            executor.submit(self.test_integration, name): name
+            for name in self._integration_classes
+        }
+        try:
+            for future in as_completed(futures, timeout=budget):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            for future, name in futures.items():
+                if name not in results:
+                    future.cancel()
+                    results[name] = {"success": False, "message": "timeout", "integration": name}
+        finally:
+            executor.shutdown(wait=False)
+        return results
+
+    async def test_all_async(self, timeout: float = None) -> Dict[str, Dict[str, Any]]:
+        """Async counterpart of test_all(): every probe runs concurrently, each bounded by `timeout`."""
+        per_test = timeout if timeout is not None else self.TEST_TIMEOUT_SECONDS
+        names = list(self._integration_classes)
+        outcomes = await asyncio.gather(
+            *[asyncio.wait_for(self._test_one_async(name), timeout=per_test) for name in names],
+            return_exceptions=True,
+        )
+        results: Dict[str, Dict[str, Any]] = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                outcome = {"success": False, "message": "timeout", "integration": name}
+            elif isinstance(outcome, Exception):
+                outcome = {"success": False, "message": f"Test failed: {str(outcome)}", "integration": name}
+            results[name] = outcome
+        return results
+
+    async def _test_one_async(self, name: str) -> Dict[str, Any]:
+        result = await self.get(name).test_connection_async()
+        result["integration"] = name
+        return result
@@ -1,28 +1,52 @@
+import asyncio
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+from app.providers.integration_hub import http_probe
 
 logger = logging.getLogger(__name__)
 
+STATUS_CACHE_TTL = 5.0
+
+# Blocking SDK calls run here so async chat() never stalls the event loop
+_LLM_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm")
+
+
+@lru_cache(maxsize=32)
+def _get_groq_client(api_key: str, model_name: str):
+    from langchain_groq import ChatGroq
+    return ChatGroq(api_key=api_key, model_name=model_name, temperature=0.1)
+
 
 class BaseModelProvider(ABC):
     """Abstract base class for all AI model providers."""
 
     name: str = "base"
     display_name: str = "Base Provider"
+    MODELS: List[str] = []
+    REQUIRES_NETWORK_CHECK: bool = False
 
     @abstractmethod
     async def chat(self, messages: List[Dict[str, str]], model: Optional[str] = None) -> str:
         pass
 
-    @abstractmethod
     def get_models(self) -> List[str]:
-        pass
+        return list(self.MODELS)
 
     @abstractmethod
     def is_configured(self) -> bool:
         pass
 
+    @classmethod
+    def default_configured(cls) -> bool:
+        """Whether a default-constructed provider would be configured, without I/O."""
+        return False
+
     def get_status(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -37,6 +61,12 @@ class GroqProvider(BaseModelProvider):
 
     name = "groq"
     display_name = "Groq"
+    MODELS = [
+        "llama-3.3-70b-versatile",
+        "llama-3.1-8b-instant",
+        "mixtral-8x7b-32768",
+        "gemma2-9b-it",
+    ]
 
     def __init__(self, api_key: str = ""):
         self._api_key = api_key
@@ -52,35 +82,34 @@ class GroqProvider(BaseModelProvider):
             return "Groq provider not configured - missing API key"
 
         try:
-            from langchain_groq import ChatGroq
-
             target_model = model or "llama-3.3-70b-versatile"
-            llm = ChatGroq(
-                api_key=self._api_key,
-                model_name=target_model,
-                temperature=0.1,
-            )
+            llm = _get_groq_client(self._api_key, target_model)
 
             prompt = "\n".join(
                 f"{m.get('role', 'user')}: {m.get('content', '')}"
                 for m in messages
             )
-            response = llm.invoke(prompt)
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_LLM_EXECUTOR, llm.invoke, prompt)
             return response.content
         except Exception as e:
             logger.error(f"[GROQ] Chat error: {e}")
             return f"Groq chat failed: {str(e)}"
 
-    def get_models(self) -> List[str]:
-        return [
-            "llama-3.3-70b-versatile",
-            "llama-3.1-8b-instant",
-            "mixtral-8x7b-32768",
-            "gemma2-9b-it",
-        ]
-
     def is_configured(self) -> bool:
-        return bool(self._api_key and self._api_key != "mock" and len(self._api_key) > 5)
+        return self._key_is_valid(self._api_key)
+
+    @staticmethod
+    def _key_is_valid(api_key: str) -> bool:
+        return bool(api_key and api_key != "mock" and len(api_key) > 5)
+
+    @classmethod
+    def default_configured(cls) -> bool:
+        try:
+            from app.core.config import settings
+            return cls._key_is_valid(settings.groq_api_key)
+        except Exception:
+            return False
 
 
 class OpenAIProvider(BaseModelProvider):
@@ -88,6 +117,7 @@ class OpenAIProvider(BaseModelProvider):
 
     name = "openai"
     display_name = "OpenAI"
+    MODELS = ["gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo"]
 
     def __init__(self, api_key: str = ""):
         self._api_key = api_key
@@ -97,9 +127,6 @@ class OpenAIProvider(BaseModelProvider):
             return "OpenAI provider not configured"
         return "OpenAI provider not yet implemented"
 
-    def get_models(self) -> List[str]:
-        return ["gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo"]
-
     def is_configured(self) -> bool:
         return bool(self._api_key and len(self._api_key) > 5)
 
@@ -109,6 +136,7 @@ class AnthropicProvider(BaseModelProvider):
 
     name = "anthropic"
     display_name = "Anthropic"
+    MODELS = ["claude-3.5-sonnet", "claude-3-haiku", "claude-3-opus"]
 
     def __init__(self, api_key: str = ""):
         self._api_key = api_key
@@ -118,9 +146,6 @@ class AnthropicProvider(BaseModelProvider):
             return "Anthropic provider not configured"
         return "Anthropic provider not yet implemented"
 
-    def get_models(self) -> List[str]:
-        return ["claude-3.5-sonnet", "claude-3-haiku", "claude-3-opus"]
-
     def is_configured(self) -> bool:
         return bool(self._api_key and len(self._api_key) > 5)
 
@@ -130,6 +155,8 @@ class OllamaProvider(BaseModelProvider):
 
     name = "ollama"
     display_name = "Ollama (Local)"
+    MODELS = ["llama3", "mistral", "codellama", "phi3"]
+    REQUIRES_NETWORK_CHECK = True
 
     def __init__(self, base_url: str = ""):
         self._base_url = base_url
@@ -145,19 +172,26 @@ class OllamaProvider(BaseModelProvider):
             return "Ollama provider not configured - cannot reach server"
         return "Ollama provider not yet implemented"
 
-    def get_models(self) -> List[str]:
-        return ["llama3", "mistral", "codellama", "phi3"]
+    _reachability: Dict[str, Tuple[float, bool]] = {}
+    _reachability_lock = threading.Lock()
 
     def is_configured(self) -> bool:
         if not self._base_url:
             return False
-        try:
-            import urllib.request
-            req = urllib.request.Request(f"{self._base_url}/api/tags", method="GET")
-            with urllib.request.urlopen(req, timeout=3):
-                return True
-        except Exception:
-            return False
+        cached = self._reachability.get(self._base_url)
+        if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        with self._reachability_lock:
+            cached = self._reachability.get(self._base_url)
+            if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+                return cached[1]
+            try:
+                http_probe(f"{self._base_url}/api/tags", timeout=(2, 3))
+                reachable = True
+            except Exception:
+                reachable = False
+            self._reachability[self._base_url] = (time.monotonic(), reachable)
+            return reachable
 
 
 _PROVIDERS = {
@@ -176,20 +210,48 @@ def get_model_provider(name: str, **kwargs) -> BaseModelProvider:
     return provider_cls(**kwargs)
 
 
+_providers_cache: Dict[str, Any] = {"t": 0.0, "payload": None}
+
+
 def list_providers() -> List[Dict[str, Any]]:
-    """Returns all providers with their current status."""
-    results = []
-    for name, cls in _PROVIDERS.items():
-        try:
-            provider = cls()
-            status = provider.get_status()
-            results.append(status)
-        except Exception as e:
-            results.append({
-                "name": name,
-                "display_name": name.title(),
-                "configured": False,
-                "models": [],
-                "error": str(e),
-            })
+    """
+    Static provider listing built from class attributes: no instantiation, no I/O.
+    `configured` is None for providers that can only be confirmed over the network.
+    """
+    return [
+        {
+            "name": cls.name,
+            "display_name": cls.display_name,
+            "configured": None if cls.REQUIRES_NETWORK_CHECK else cls.default_configured(),
+            "models": list(cls.MODELS),
+        }
+        for cls in _PROVIDERS.values()
+    ]
+
+
+async def list_providers_with_health() -> List[Dict[str, Any]]:
+    """
+    Live provider listing: each provider's status (including the Ollama
+    reachability probe) is computed concurrently. Cached for STATUS_CACHE_TTL seconds.
+    """
+    if _providers_cache["payload"] is not None and time.monotonic() - _providers_cache["t"] < STATUS_CACHE_TTL:
+        return _providers_cache["payload"]
+    results = list(await asyncio.gather(
+        *[asyncio.to_thread(_provider_status, name, cls) for name, cls in _PROVIDERS.items()]
+    ))
+    _providers_cache["payload"] = results
+    _providers_cache["t"] = time.monotonic()
     return results
+
+
+def _provider_status(name: str, cls) -> Dict[str, Any]:
+    try:
+        return cls().get_status()
+    except Exception as e:
+        return {
+            "name": name,
+            "display_name": name.title(),
+            "configured": False,
+            "models": list(cls.MODELS),
+            "error": str(e),
+        }
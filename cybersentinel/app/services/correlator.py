@@ -1,8 +1,35 @@
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import asyncio
 import logging
+import re
+import threading
 from langchain_groq import ChatGroq
 from app.core.config import settings
 
+_LLM: Optional[ChatGroq] = None
+_LLM_LOCK = threading.Lock()
+
+
+def _get_llm() -> ChatGroq:
+    """Lazily build one shared client so its HTTP pool survives across calls."""
+    global _LLM
+    if _LLM is None:
+        with _LLM_LOCK:
+            if _LLM is None:
+                _LLM = ChatGroq(
+                    api_key=settings.groq_api_key,
+                    model_name=settings.analyst_model,
+                    temperature=0.1,
+                    max_retries=1,
+                    timeout=30,
+                )
+    return _LLM
+
+
+def _format_incidents(recent_incidents: List[Dict[str, Any]]) -> str:
+    return "\n".join([f"- ID: {i['alert_id']} | Source: {i['source_type']} | Log: {i['raw_log']}" for i in recent_incidents])
+
+
 def correlate_logs(current_log: str, recent_incidents: List[Dict[str, Any]]) -> str:
     """
     Advanced Cyber-Skill: Log Correlation.
@@ -11,7 +38,7 @@ def correlate_logs(current_log: str, recent_incidents: List[Dict[str, Any]]) ->
     if not recent_incidents:
         return "No recent incidents available for correlation."
         
-    incidents_text = "\n".join([f"- ID: {i['alert_id']} | Source: {i['source_type']} | Log: {i['raw_log']}" for i in recent_incidents])
+    incidents_text = _format_incidents(recent_incidents)
     
     prompt = f"""You are an advanced SOC Log Correlation Engine.
 
@@ -28,13 +55,142 @@ Provide a concise correlation summary. If there is no correlation, state "No cor
 """
 
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.analyst_model,
-            temperature=0.1,
-        )
+        llm = _get_llm()
         response = llm.invoke(prompt)
         return response.content
     except Exception as e:
         logging.error(f"Correlation error: {e}")
         return "Correlation engine unavailable."
+
+
+_BATCH_ANSWER_RE = re.compile(r"ID\s*=\s*(\d+)\s*;\s*Summary\s*=\s*", re.IGNORECASE)
+
+
+class CorrelationBatcher:
+    """
+    Coalesces concurrent correlation requests into one LLM call.
+    Requests that share the same recent-incident context are collected for up
+    to MAX_WAIT_MS (or until MAX_BATCH are pending), sent as a single numbered
+    prompt, and the numbered answers are routed back to each caller. Any log
+    the model fails to answer for falls back to an individual correlate_one().
+    """
+
+    MAX_BATCH = 8
+    MAX_WAIT_MS = 50
+
+    def __init__(self,
+                 correlate_one: Callable[[str, List[Dict[str, Any]]], str] = correlate_logs,
+                 format_incidents: Callable[[List[Dict[str, Any]]], str] = _format_incidents,
+                 get_llm: Callable[[], Any] = _get_llm):
+        self._correlate_one = correlate_one
+        self._format_incidents = format_incidents
+        self._get_llm = get_llm
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, current_log: str, recent_incidents: List[Dict[str, Any]]) -> str:
+        if not recent_incidents:
+            return "No recent incidents available for correlation."
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((current_log, recent_incidents, future))
+        return await future
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and self._worker.get_loop() is loop:
+            if not self._worker.done():
+                return
+        else:
+            # Queued futures belong to the old loop; only then start a fresh queue
+            self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.MAX_WAIT_MS / 1000
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            groups: Dict[Tuple, List] = {}
+            for item in batch:
+                key = tuple(i.get("alert_id") for i in item[1])
+                groups.setdefault(key, []).append(item)
+            await asyncio.gather(*[self._dispatch(group) for group in groups.values()])
+
+    async def _dispatch(self, group: List):
+        # Every future is resolved here, with a result or the exception that
+        # correlate_one() raised, so a failure never reaches the worker loop
+        answers: Dict[int, str] = {}
+        if len(group) > 1:
+            try:
+                answers = await asyncio.to_thread(self._correlate_batch, group)
+            except Exception as e:
+                logging.error(f"Batched correlation error: {e}")
+
+        # Unanswered logs fall back to individual calls, run concurrently
+        await asyncio.gather(*[
+            self._resolve(item, answers.get(idx))
+            for idx, item in enumerate(group)
+            if not item[2].done()
+        ])
+
+    async def _resolve(self, item: Tuple, answer: Optional[str]):
+        current_log, recent_incidents, future = item
+        if answer is None:
+            try:
+                answer = await asyncio.to_thread(self._correlate_one, current_log, recent_incidents)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+        if not future.done():
+            future.set_result(answer)
+
+    def _correlate_batch(self, group: List) -> Dict[int, str]:
+        logs_text = "\n".join(f"LOG {n}:\n{item[0]}" for n, item in enumerate(group, start=1))
+        try:
+            prompt = f"""You are an advanced SOC Log Correlation Engine.
+
+CURRENT LOGS 1..{len(group)}:
+{logs_text}
+
+RECENT NETWORK/SYSTEM INCIDENTS:
+{self._format_incidents(group[0][1])}
+
+Your task:
+For each current log, analyze it alongside the recent incidents and determine if they are part of a broader, coordinated attack pattern (e.g., Lateral Movement, Distributed Brute Force, Multi-vector attack).
+
+For each log, output exactly one entry in the form:
+ID=<n>; Summary=<concise correlation summary, or "No correlation found.">
+"""
+            content = self._get_llm().invoke(prompt).content
+        except Exception as e:
+            logging.error(f"Batched correlation error: {e}")
+            return {}
+
+        answers: Dict[int, str] = {}
+        markers = list(_BATCH_ANSWER_RE.finditer(content))
+        for pos, match in enumerate(markers):
+            end = markers[pos + 1].start() if pos + 1 < len(markers) else len(content)
+            idx = int(match.group(1)) - 1
+            summary = content[match.end():end].strip()
+            if 0 <= idx < len(group) and summary:
+                answers[idx] = summary
+        return answers
+
+
+correlation_batcher = CorrelationBatcher()
+
+
+async def correlate_logs_async(current_log: str, recent_incidents: List[Dict[str, Any]]) -> str:
+    """Batched, awaitable variant of correlate_logs()."""
+    return await correlation_batcher.submit(current_log, recent_incidents)
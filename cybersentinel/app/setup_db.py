@@ -1,12 +1,25 @@
 import os
 import logging
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from app.core.config import settings
 from app.core.memory import Base
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns added to `incidents` after its first release
+PATCH_COLUMNS = {
+    "risk_level": "TEXT",
+    "category": "TEXT",
+    "summary": "TEXT",
+    "source_type": "TEXT",
+    "fingerprint": "TEXT",
+}
+# Indexes the model declares on patched columns, as {column: index name}
+PATCH_INDEXES = {
+    "fingerprint": "ix_incidents_fingerprint",
+}
+
 
 def migrate_database():
     """Force create/migrate tables to the Replit Managed PostgreSQL database."""
@@ -21,19 +34,28 @@ def migrate_database():
         logger.info("Connecting to Replit Managed PostgreSQL...")
 
         logger.info("Creating tables from models...")
-        Base.metadata.create_all(engine)
+        Base.metadata.create_all(engine, checkfirst=True)
 
         logger.info("Verifying columns and patching...")
-        with engine.connect() as conn:
-            alter_queries = [
-                "ALTER TABLE incidents ADD COLUMN IF NOT EXISTS risk_level TEXT",
-                "ALTER TABLE incidents ADD COLUMN IF NOT EXISTS category TEXT",
-                "ALTER TABLE incidents ADD COLUMN IF NOT EXISTS summary TEXT",
-                "ALTER TABLE incidents ADD COLUMN IF NOT EXISTS source_type TEXT"
-            ]
-            for query in alter_queries:
-                conn.execute(text(query))
-                conn.commit()
+        existing = {col["name"] for col in inspect(engine).get_columns("incidents")}
+        alter_queries = [
+            f"ALTER TABLE incidents ADD COLUMN IF NOT EXISTS {name} {col_type}"
+            for name, col_type in PATCH_COLUMNS.items()
+            if name not in existing
+        ]
+        if alter_queries:
+            with engine.begin() as conn:
+                for query in alter_queries:
+                    conn.execute(text(query))
+            logger.info(f"Added columns: {len(alter_queries)}")
+        else:
+            logger.info("Schema already up to date.")
+
+        with engine.begin() as conn:
+            for column, index_name in PATCH_INDEXES.items():
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON incidents ({column})"
+                ))
 
         logger.info("Database migration completed successfully.")
 
@@ -1,14 +1,55 @@
 import logging
 import re
-from collections import defaultdict
-from typing import Dict, List
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Set
 
-def execute_dns_anomaly_detector(dns_queries: List[str], threshold: int = 5, max_query_length: int = 100) -> Dict:
+logger = logging.getLogger(__name__)
+
+_MIN_TUNNEL_RUN = 10
+_TUNNEL_RE = re.compile(r'[a-zA-Z0-9_-]{%d,}' % _MIN_TUNNEL_RUN)
+
+
+def _scan_tunneling(queries: List[str]) -> Set[int]:
+    """
+    Return indices of queries containing a tunneling-like label run.
+    Queries shorter than the run length cannot match and are dropped up
+    front; the rest are scanned in one regex sweep over a newline-joined
+    buffer (the pattern cannot match across '\n'), resuming at the next
+    query after each hit instead of calling search() once per query.
+    """
+    candidates = [idx for idx, query in enumerate(queries) if len(query) >= _MIN_TUNNEL_RUN]
+    if not candidates:
+        return set()
+
+    starts = []
+    offset = 0
+    for idx in candidates:
+        starts.append(offset)
+        offset += len(queries[idx]) + 1
+    buffer = "\n".join([queries[idx] for idx in candidates])
+
+    hits = set()
+    pos = 0
+    search = _TUNNEL_RE.search
+    while True:
+        match = search(buffer, pos)
+        if match is None:
+            break
+        slot = bisect_right(starts, match.start()) - 1
+        hits.add(candidates[slot])
+        if slot + 1 >= len(starts):
+            break
+        pos = starts[slot + 1]
+    return hits
+
+
+def execute_dns_anomaly_detector(dns_queries: Iterable[str], threshold: int = 5, max_query_length: int = 100) -> Dict:
     """
     Detect DNS tunneling and exfiltration by analyzing DNS query patterns.
 
     Args:
-    - dns_queries (List[str]): A list of DNS queries to analyze.
+    - dns_queries (Iterable[str]): DNS queries to analyze; consumed in a single pass, so a generator works.
     - threshold (int): The minimum number of similar queries required to trigger an anomaly detection. Defaults to 5.
     - max_query_length (int): The maximum length of a DNS query. Defaults to 100.
 
@@ -16,31 +57,38 @@ def execute_dns_anomaly_detector(dns_queries: List[str], threshold: int = 5, max
     - Dict: A dictionary containing the status, result, and details of the anomaly detection.
     """
 
-    logging.basicConfig(level=logging.INFO)
     result = {'status': 'success', 'result': False, 'details': {}}
 
     try:
-        query_counts = defaultdict(int)
-        for query in dns_queries:
+        # Counter tallies in C; length checks then run once per distinct query
+        query_counts = Counter(dns_queries)
+        suspicious_queries = {}
+        warn_enabled = logger.isEnabledFor(logging.WARNING)
+        for query, count in query_counts.items():
             if len(query) > max_query_length:
-                logging.warning(f"DNS query exceeds maximum length: {query}")
+                if warn_enabled:
+                    logger.warning(f"DNS query exceeds maximum length ({count}x): {query}")
                 continue
-            query_counts[query] += 1
-
-        suspicious_queries = {query: count for query, count in query_counts.items() if count > threshold}
+            if count > threshold:
+                suspicious_queries[query] = count
         if suspicious_queries:
             result['result'] = True
             result['details'] = {'suspicious_queries': suspicious_queries}
 
-        # Check for DNS tunneling patterns
-        tunneling_pattern = re.compile(r'[a-zA-Z0-9_-]{10,}')
-        tunneling_queries = [query for query in dns_queries if tunneling_pattern.search(query)]
+        # Check for DNS tunneling patterns. Each distinct query is scanned once and
+        # hits are expanded from the counts (grouped, first-seen order), so the
+        # input is never re-read.
+        unique_queries = list(query_counts)
+        tunneling_queries = []
+        for idx in sorted(_scan_tunneling(unique_queries)):
+            query = unique_queries[idx]
+            tunneling_queries.extend([query] * query_counts[query])
         if tunneling_queries:
             result['result'] = True
             result['details']['tunneling_queries'] = tunneling_queries
 
     except Exception as e:
-        logging.error(f"Error executing DNS anomaly detector: {e}")
+        logger.error(f"Error executing DNS anomaly detector: {e}")
         result['status'] = 'error'
         result['details']['error'] = str(e)
 
@@ -1,44 +1,90 @@
 import logging
 import re
+from bisect import bisect_right
 
-def execute_log4j_detector(log_entries, http_headers):
+try:
+    import re2 as _regex  # google-re2: linear-time DFA matching
+except ImportError:
+    _regex = re
+
+logger = logging.getLogger(__name__)
+
+# Entries are scanned as one buffer joined on NUL
+_ENTRY_SEP = "\x00"
+# Every match starts with "${"; a plain substring test (case-invariant, unlike
+# "jndi") rules out the common clean input before the regex engine runs.
+_LOOKUP_PREFIX = "${"
+# JNDI lookup strings; case-insensitive since Log4j resolves "${JNDI:" as well.
+# NUL is excluded from the URL body so a match can never span the separator.
+# Inline (?i) keeps the pattern portable between `re` and RE2.
+_JNDI_RE = _regex.compile(r'(?i)\$\{jndi:(?:ldap|ldaps|dns|http|https)://[^}\x00]+\}')
+
+
+def _matching_entries(entries, first_only=False):
+    """Indices of entries matching _JNDI_RE, found in one sweep over the joined entries."""
+    entries = list(entries)
+    starts = []
+    offset = 0
+    for entry in entries:
+        starts.append(offset)
+        offset += len(entry) + 1
+    buffer = _ENTRY_SEP.join(entries)
+    if _LOOKUP_PREFIX not in buffer:
+        return entries, []
+
+    hits = []
+    pos = 0
+    while True:
+        match = _JNDI_RE.search(buffer, pos)
+        if match is None:
+            break
+        idx = bisect_right(starts, match.start()) - 1
+        hits.append(idx)
+        if first_only or idx + 1 >= len(starts):
+            break
+        pos = starts[idx + 1]
+    return entries, hits
+
+
+def execute_log4j_detector(log_entries, http_headers, first_match_only=False):
     """
     Analyze log entries for Log4j/Log4Shell (CVE-2021-44228) exploitation patterns.
     
     Args:
         log_entries (list): List of log entries to analyze.
         http_headers (dict): Dictionary of HTTP headers to analyze.
+        first_match_only (bool): Stop scanning at the first detection. 'result' is
+            still accurate, but 'details' then holds only that first finding.
     
     Returns:
         dict: Dictionary with 'status', 'result', and 'details' keys.
     """
-    logging.basicConfig(level=logging.INFO)
     result = {'status': 'success', 'result': False, 'details': []}
     
     try:
-        # Define the pattern for JNDI lookup strings
-        pattern = r'\${jndi:(ldap|ldaps|dns|http|https)://[^}]+}'
-        
         # Analyze log entries
-        for entry in log_entries:
-            if re.search(pattern, entry):
-                result['result'] = True
-                result['details'].append(f"Log entry: {entry} contains a potential Log4j exploitation pattern")
+        entries, hits = _matching_entries(log_entries, first_only=first_match_only)
+        for idx in hits:
+            result['result'] = True
+            result['details'].append(f"Log entry: {entries[idx]} contains a potential Log4j exploitation pattern")
         
         # Analyze HTTP headers
-        for header, value in http_headers.items():
-            if re.search(pattern, value):
-                result['result'] = True
-                result['details'].append(f"HTTP header '{header}': {value} contains a potential Log4j exploitation pattern")
+        if not (first_match_only and result['result']):
+            for header, value in http_headers.items():
+                if _LOOKUP_PREFIX in value and _JNDI_RE.search(value):
+                    result['result'] = True
+                    result['details'].append(f"HTTP header '{header}': {value} contains a potential Log4j exploitation pattern")
+                    if first_match_only:
+                        break
         
         if result['result']:
-            logging.warning("Potential Log4j exploitation pattern detected")
+            logger.warning("Potential Log4j exploitation pattern detected")
         else:
-            logging.info("No potential Log4j exploitation patterns detected")
+            logger.info("No potential Log4j exploitation patterns detected")
     
     except Exception as e:
         result['status'] = 'failure'
         result['details'].append(f"An error occurred: {str(e)}")
-        logging.error(f"An error occurred: {str(e)}")
+        logger.error(f"An error occurred: {str(e)}")
     
     return result
\ No newline at end of file
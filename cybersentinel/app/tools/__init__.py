@@ -2,7 +2,7 @@ from app.tools.history_analyst import search_history
 from app.tools.threat_intel import lookup_threat_intel
 from app.tools.response_executor import execute_response
 from app.tools.memory_consolidator import consolidate_memory
-from app.tools.log_correlator import correlate_logs_tool
+from app.tools.log_correlator import correlate_logs_tool, correlate_logs_tool_async
 from app.tools.analyst_tool import analyze_log_tool
 from app.tools.skeptic_tool import challenge_analysis_tool
 from app.tools.judge_tool import make_verdict_tool
@@ -1,13 +1,66 @@
-from langchain_groq import ChatGroq
+from app.tools.llm_client import get_llm
 from app.core.config import settings
 from app.core.memory import memory
+from app.utils.ttl_cache import TTLCache
 import logging
 import asyncio
-import json
-import re
+import hashlib
+from typing import Optional
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Bursty alert streams repeat the same (masked) log; skip the vector search for
+# repeats. Short TTL so newly consolidated lessons show up quickly.
+_similar_cache = TTLCache(maxsize=4096, ttl=300.0)
+
+
+def _similar_cases(log_text: str, n_results: int = 1) -> list:
+    key = (hashlib.blake2b(log_text.encode(), digest_size=16).digest(), n_results)
+    cases = _similar_cache.get(key)
+    if cases is None:
+        cases = memory.get_similar_cases(log_text, n_results=n_results)
+        _similar_cache.set(key, cases)
+    return cases
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """
+    Return the first brace-balanced {...} object in `text` (string-aware, so
+    braces inside JSON strings are ignored). Falls back to the outermost
+    first-'{' .. last-'}' slice when the braces never balance.
+    """
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end < start:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for pos in range(start, end + 1):
+        ch = text[pos]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return text[start:end + 1]
+
 
 def analyze_log_tool(log_text: str, context: str = "") -> dict:
     """
@@ -15,7 +68,7 @@ def analyze_log_tool(log_text: str, context: str = "") -> dict:
     Acts as a Tier 1 SOC Analyst investigating SIEM logs.
     Uses Groq LLM with chain-of-thought reasoning.
     """
-    similar_cases = memory.get_similar_cases(log_text, n_results=1)
+    similar_cases = _similar_cases(log_text, n_results=1)
     context_from_memory = similar_cases[0] if similar_cases else "No historical context available."
 
     full_context = context if context else ""
@@ -42,16 +95,12 @@ OUTPUT FORMAT (Strictly JSON):
 """
 
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.analyst_model,
-            temperature=0.1,
-        )
+        llm = get_llm(settings.analyst_model, 0.1)
         response = llm.invoke(prompt)
 
-        json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group())
+        json_text = _extract_json(response.content)
+        if json_text:
+            return _json_loads(json_text)
 
         return {
             "risk_level": "Medium",
@@ -1,5 +1,5 @@
 import logging
-from langchain_groq import ChatGroq
+from app.tools.llm_client import get_llm
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -26,11 +26,7 @@ Provide a detailed, actionable response. Include specific remediation steps wher
 Format your response clearly with sections for: Analysis, Findings, and Recommended Actions.
 """
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.analyst_model,
-            temperature=0.2,
-        )
+        llm = get_llm(settings.analyst_model, 0.2)
         response = llm.invoke(prompt)
         return {
             "agent": "Blue Team",
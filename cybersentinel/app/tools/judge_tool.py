@@ -1,4 +1,4 @@
-from langchain_groq import ChatGroq
+from app.tools.llm_client import get_llm
 from app.core.config import settings
 import logging
 
@@ -36,11 +36,7 @@ Respond ONLY with your verdict, reasoning, and remediation. Be decisive.
 """
 
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.reviewer_model,
-            temperature=0.2,
-        )
+        llm = get_llm(settings.reviewer_model, 0.2)
         response = llm.invoke(prompt)
         verdict_text = response.content
 
@@ -0,0 +1,16 @@
+import functools
+from langchain_groq import ChatGroq
+from app.core.config import settings
+
+
+@functools.lru_cache(maxsize=16)
+def get_llm(model: str, temperature: float) -> ChatGroq:
+    """
+    Shared ChatGroq client per (model, temperature).
+    Reusing the client keeps its HTTP connection pool warm across tool calls.
+    """
+    return ChatGroq(
+        api_key=settings.groq_api_key,
+        model_name=model,
+        temperature=temperature,
+    )
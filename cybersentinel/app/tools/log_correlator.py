@@ -1,11 +1,22 @@
 from typing import Dict, Any, List
 import logging
 import asyncio
-from langchain_groq import ChatGroq
+from app.tools.llm_client import get_llm
 from app.core.config import settings
+from app.services.correlator import CorrelationBatcher
 
 logger = logging.getLogger(__name__)
 
+_format_incident = "- ID: {} | Source: {} | Log: {}".format
+
+
+def _format_incidents(recent_incidents: List[Dict[str, Any]]) -> str:
+    return "\n".join([
+        _format_incident(i.get('alert_id', '?'), i.get('source_type', '?'),
+                         (i.get('raw_log') or '')[:100])
+        for i in recent_incidents
+    ])
+
 
 def correlate_logs_tool(current_log: str,
                         recent_incidents: List[Dict[str, Any]]) -> str:
@@ -16,10 +27,7 @@ def correlate_logs_tool(current_log: str,
     if not recent_incidents:
         return "No recent incidents available for correlation."
 
-    incidents_text = "\n".join([
-        f"- ID: {i.get('alert_id','?')} | Source: {i.get('source_type','?')} | Log: {i.get('raw_log','')[:100]}"
-        for i in recent_incidents
-    ])
+    incidents_text = _format_incidents(recent_incidents)
 
     prompt = f"""You are an advanced SOC Log Correlation Engine.
 
@@ -36,13 +44,26 @@ Provide a concise correlation summary. If there is no correlation, state "No cor
 """
 
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.analyst_model,
-            temperature=0.1,
-        )
+        llm = get_llm(settings.analyst_model, 0.1)
         response = llm.invoke(prompt)
         return response.content
     except Exception as e:
         logger.error(f"Correlation error: {e}")
         return "Correlation engine unavailable."
+
+
+_batcher = CorrelationBatcher(
+    correlate_one=correlate_logs_tool,
+    format_incidents=_format_incidents,
+    get_llm=lambda: get_llm(settings.analyst_model, 0.1),
+)
+
+
+async def correlate_logs_tool_async(current_log: str,
+                                    recent_incidents: List[Dict[str, Any]]) -> str:
+    """
+    Tool: LogCorrelator (batched)
+    Concurrent alerts that share the same recent incidents are correlated in
+    one LLM call; see CorrelationBatcher.
+    """
+    return await _batcher.submit(current_log[:500], recent_incidents)
@@ -1,8 +1,105 @@
+import atexit
 import logging
+import queue
+import threading
+import time
+from typing import Optional
 from app.core.memory import memory
 
 logger = logging.getLogger(__name__)
 
+LESSON_BATCH_SIZE = 64
+LESSON_FLUSH_INTERVAL = 2.0
+
+# Write-behind buffer: lessons are embedded and indexed in batches off the
+# alert path instead of one cases_collection.add() per alert.
+_pending: "queue.Queue" = queue.Queue()
+_write_lock = threading.Lock()
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _write_batch(batch: list):
+    documents, metadatas, ids = [], [], []
+    seen = set()
+    for doc, meta, doc_id in batch:
+        # Chroma rejects duplicate ids within one add(); first write wins, as before
+        if doc_id in seen:
+            continue
+        seen.add(doc_id)
+        documents.append(doc)
+        metadatas.append(meta)
+        ids.append(doc_id)
+    try:
+        memory.cases_collection.add(documents=documents, metadatas=metadatas, ids=ids)
+        logger.info(f"[TOOL:MemoryConsolidator] Saved {len(ids)} lesson(s)")
+        return
+    except Exception as e:
+        if len(ids) == 1:
+            logger.error(f"Memory consolidation failed for {ids[0]}: {e}")
+            return
+        logger.warning(f"[TOOL:MemoryConsolidator] Batch of {len(ids)} rejected ({e}); retrying one by one")
+
+    # One bad lesson must not discard the rest of the batch
+    for doc, meta, doc_id in zip(documents, metadatas, ids):
+        try:
+            memory.cases_collection.add(documents=[doc], metadatas=[meta], ids=[doc_id])
+        except Exception as e:
+            logger.error(f"Memory consolidation failed for {doc_id}: {e}")
+
+
+def _drain(batch: list, deadline: float):
+    while len(batch) < LESSON_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_pending.get(timeout=remaining))
+        except queue.Empty:
+            break
+
+
+def _writer_loop():
+    while True:
+        batch = [_pending.get()]
+        _drain(batch, time.monotonic() + LESSON_FLUSH_INTERVAL)
+        with _write_lock:
+            _write_batch(batch)
+        for _ in batch:
+            _pending.task_done()
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None and _writer.is_alive():
+        return
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_writer_loop, name="lesson-writer", daemon=True)
+            _writer.start()
+
+
+def flush_lessons(timeout: float = 5.0):
+    """Write any queued lessons now; registered to run at interpreter exit."""
+    batch = []
+    while True:
+        try:
+            batch.append(_pending.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        with _write_lock:
+            _write_batch(batch)
+        for _ in batch:
+            _pending.task_done()
+
+    deadline = time.monotonic() + timeout
+    while _pending.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+atexit.register(flush_lessons)
+
 
 def consolidate_memory(alert_id: str, masked_log: str,
                        verdict: str, reasoning: str) -> str:
@@ -10,18 +107,20 @@ def consolidate_memory(alert_id: str, masked_log: str,
     Tool: MemoryConsolidator
     Summarizes the case and saves "Lessons Learned" back to Vector Memory.
     This is the key to the self-learning loop.
+    The write is queued and flushed in batches by a background thread.
     """
     logger.info(f"[TOOL:MemoryConsolidator] Consolidating case {alert_id}...")
 
-    summary = f"Alert {alert_id} analyzed. Verdict: {verdict}. Key reasoning: {reasoning[:200]}"
-
     try:
-        memory.cases_collection.add(
-            documents=[f"Lesson Learned: {summary}\nLog: {masked_log}"],
-            metadatas=[{"alert_id": alert_id, "verdict": verdict, "type": "lesson_learned"}],
-            ids=[f"lesson_{alert_id}"]
-        )
-        logger.info(f"[TOOL:MemoryConsolidator] Lesson saved for {alert_id}")
+        snippet = reasoning if len(reasoning) <= 200 else reasoning[:200]
+        summary = f"Alert {alert_id} analyzed. Verdict: {verdict}. Key reasoning: {snippet}"
+        _ensure_writer()
+        _pending.put((
+            f"Lesson Learned: {summary}\nLog: {masked_log}",
+            {"alert_id": alert_id, "verdict": verdict, "type": "lesson_learned"},
+            f"lesson_{alert_id}",
+        ))
+        logger.info(f"[TOOL:MemoryConsolidator] Lesson queued for {alert_id}")
         return summary
     except Exception as e:
         logger.error(f"Memory consolidation failed: {e}")
@@ -1,5 +1,5 @@
 import logging
-from langchain_groq import ChatGroq
+from app.tools.llm_client import get_llm
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -30,11 +30,7 @@ Provide a comprehensive response with:
 - Metrics: How to measure improvement
 """
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.analyst_model,
-            temperature=0.3,
-        )
+        llm = get_llm(settings.analyst_model, 0.3)
         response = llm.invoke(prompt)
         return {
             "agent": "Purple Team",
@@ -1,5 +1,5 @@
 import logging
-from langchain_groq import ChatGroq
+from app.tools.llm_client import get_llm
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -29,11 +29,7 @@ Provide a detailed response with: Attack Vectors Identified, Vulnerability Asses
 Exploitation Potential (rated Low/Medium/High/Critical), and Defensive Recommendations.
 """
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.analyst_model,
-            temperature=0.3,
-        )
+        llm = get_llm(settings.analyst_model, 0.3)
         response = llm.invoke(prompt)
         return {
             "agent": "Red Team",
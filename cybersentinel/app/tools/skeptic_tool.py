@@ -1,4 +1,4 @@
-from langchain_groq import ChatGroq
+from app.tools.llm_client import get_llm
 from app.core.config import settings
 import logging
 
@@ -33,11 +33,7 @@ Be critical but constructive. Your goal is to prevent alert fatigue from False P
 """
 
     try:
-        llm = ChatGroq(
-            api_key=settings.groq_api_key,
-            model_name=settings.reviewer_model,
-            temperature=0.7,
-        )
+        llm = get_llm(settings.reviewer_model, 0.7)
         response = llm.invoke(prompt)
         return response.content
     except Exception as e:
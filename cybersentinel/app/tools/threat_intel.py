@@ -1,18 +1,51 @@
+import asyncio
 import logging
-import requests
+import threading
+from typing import List, Optional, Tuple
+import httpx
 from app.core.config import settings
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+VT_TIMEOUT = 10.0
 
-def lookup_threat_intel(ioc: str, ioc_type: str = "ip") -> dict:
-    """
-    Tool: ThreatIntelLookup
-    Connects to VirusTotal/AbuseIPDB for threat intelligence on an IOC.
-    Falls back to mock data if no API key is configured.
-    """
-    logger.info(f"[TOOL:ThreatIntel] Looking up {ioc_type}: {ioc}")
+# Pooled clients: consecutive IOC lookups reuse the TLS connection to VirusTotal
+_vt_client: Optional[httpx.Client] = None
+_vt_async_client: Optional[httpx.AsyncClient] = None
+_client_lock = threading.Lock()
+
+# Reputation cache keyed by (ioc, ioc_type). Flagged IOCs rarely turn clean, so
+# they are kept for a day; clean verdicts can flip and expire after 10 minutes.
+# Error payloads are never cached so transient failures are retried.
+POSITIVE_TTL = 24 * 3600
+NEGATIVE_TTL = 10 * 60
+_intel_cache = TTLCache(maxsize=10000, ttl=POSITIVE_TTL)
+
+
+def _get_vt_client() -> httpx.Client:
+    global _vt_client
+    if _vt_client is None:
+        with _client_lock:
+            if _vt_client is None:
+                _vt_client = httpx.Client(
+                    headers={"x-apikey": settings.vt_api_key},
+                    timeout=VT_TIMEOUT,
+                )
+    return _vt_client
+
+
+def _get_vt_async_client() -> httpx.AsyncClient:
+    global _vt_async_client
+    if _vt_async_client is None or _vt_async_client.is_closed:
+        _vt_async_client = httpx.AsyncClient(
+            headers={"x-apikey": settings.vt_api_key},
+            timeout=VT_TIMEOUT,
+        )
+    return _vt_async_client
 
+
+def _mock_result(ioc: str, ioc_type: str) -> Optional[dict]:
     if settings.vt_api_key == "mock" or not settings.vt_api_key:
         return {
             "ioc": ioc,
@@ -21,19 +54,89 @@ def lookup_threat_intel(ioc: str, ioc_type: str = "ip") -> dict:
             "reputation": "clean",
             "source": "mock_virustotal"
         }
+    return None
+
+
+def _is_flagged(result: dict) -> bool:
+    stats = (result.get("data") or {}).get("attributes", {}).get("last_analysis_stats", {})
+    return bool(result.get("malicious") or stats.get("malicious") or stats.get("suspicious"))
+
+
+def _cache_result(ioc: str, ioc_type: str, result: dict) -> None:
+    if "error" in result:
+        return
+    ttl = POSITIVE_TTL if _is_flagged(result) else NEGATIVE_TTL
+    _intel_cache.set((ioc, ioc_type), result, ttl=ttl)
+
+
+def _vt_url(ioc: str, ioc_type: str) -> Optional[str]:
+    if ioc_type == "ip":
+        return f"https://www.virustotal.com/api/v3/ip_addresses/{ioc}"
+    if ioc_type == "domain":
+        return f"https://www.virustotal.com/api/v3/domains/{ioc}"
+    return None
+
+
+def lookup_threat_intel(ioc: str, ioc_type: str = "ip") -> dict:
+    """
+    Tool: ThreatIntelLookup
+    Connects to VirusTotal/AbuseIPDB for threat intelligence on an IOC.
+    Falls back to mock data if no API key is configured.
+    """
+    logger.info(f"[TOOL:ThreatIntel] Looking up {ioc_type}: {ioc}")
+
+    mock = _mock_result(ioc, ioc_type)
+    if mock is not None:
+        return mock
+
+    cached = _intel_cache.get((ioc, ioc_type))
+    if cached is not None:
+        return cached
+
+    try:
+        url = _vt_url(ioc, ioc_type)
+        if url is None:
+            return {"error": "Unsupported IOC type"}
+
+        response = _get_vt_client().get(url)
+        response.raise_for_status()
+        result = response.json()
+        _cache_result(ioc, ioc_type, result)
+        return result
+    except Exception as e:
+        logger.error(f"ThreatIntel lookup failed: {e}")
+        return {"error": str(e), "fallback": "mock_data"}
+
+
+async def lookup_threat_intel_async(ioc: str, ioc_type: str = "ip") -> dict:
+    """Non-blocking variant of lookup_threat_intel() on a shared httpx.AsyncClient."""
+    logger.info(f"[TOOL:ThreatIntel] Looking up {ioc_type}: {ioc}")
+
+    mock = _mock_result(ioc, ioc_type)
+    if mock is not None:
+        return mock
+
+    cached = _intel_cache.get((ioc, ioc_type))
+    if cached is not None:
+        return cached
 
     try:
-        headers = {"x-apikey": settings.vt_api_key}
-        if ioc_type == "ip":
-            url = f"https://www.virustotal.com/api/v3/ip_addresses/{ioc}"
-        elif ioc_type == "domain":
-            url = f"https://www.virustotal.com/api/v3/domains/{ioc}"
-        else:
+        url = _vt_url(ioc, ioc_type)
+        if url is None:
             return {"error": "Unsupported IOC type"}
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await _get_vt_async_client().get(url)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        _cache_result(ioc, ioc_type, result)
+        return result
     except Exception as e:
         logger.error(f"ThreatIntel lookup failed: {e}")
         return {"error": str(e), "fallback": "mock_data"}
+
+
+async def lookup_threat_intel_many(iocs: List[Tuple[str, str]]) -> List[dict]:
+    """Look up several (ioc, ioc_type) pairs concurrently; results keep input order."""
+    return list(await asyncio.gather(
+        *[lookup_threat_intel_async(ioc, ioc_type) for ioc, ioc_type in iocs]
+    ))
@@ -1,3 +1,9 @@
-from config.infra_adapter import Infra
+from config.infra_adapter import get_infra
 
-__all__ = ["Infra"]
+__all__ = ["Infra", "get_infra"]
+
+
+def __getattr__(name: str):
+    if name == "Infra":
+        return get_infra()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
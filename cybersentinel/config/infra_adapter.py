@@ -14,15 +14,199 @@ Supported Providers:
   - LOCAL   : SQLite + local filesystem (development fallback)
 """
 
+import asyncio
+import functools
+import io
 import os
 import logging
-from typing import Optional, Any, Dict, List
+import shutil
+import threading
+import weakref
+from typing import Optional, Any, BinaryIO, Dict, Iterable, Iterator, List, Union
 from pathlib import Path
 
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.pool import NullPool
+
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
+except ImportError:
+    boto3 = None
+
+try:
+    import aioboto3
+    from aiobotocore.config import AioConfig
+except ImportError:
+    aioboto3 = None
+
 logger = logging.getLogger(__name__)
 
 INFRA_PROVIDER = os.environ.get("INFRA_PROVIDER", "REPLIT").upper()
 
+# S3 uploads at or above this size go through the transfer manager as parallel parts
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+S3_MAX_CONCURRENCY = 10
+# Downloads at or above this size are fetched as concurrent byte ranges
+S3_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+S3_DOWNLOAD_CHUNKSIZE = 16 * 1024 * 1024
+S3_DOWNLOAD_CONCURRENCY = 16
+
+# save_file() accepts whole payloads or streams; streams are copied in chunks of this size
+FileContent = Union[bytes, bytearray, memoryview, BinaryIO, Iterable[bytes]]
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+STREAM_CHUNK_SIZE = 1 << 20
+# Local writes are staged as ".<name>.<pid>.<tid>.tmp" next to the target
+_TEMP_SUFFIX = ".tmp"
+
+# QueuePool sizing for server databases, per process
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+DB_POOL_OVERFLOW = int(os.environ.get("DB_POOL_OVERFLOW", "20"))
+DB_POOL_RECYCLE = 1800
+
+# One engine (and connection pool) per database URL for the whole process
+_engine_cache: Dict[str, Any] = {}
+_engine_lock = threading.Lock()
+
+# Compiled-statement cache per engine; sized above SQLAlchemy's default of 500
+SQL_COMPILE_CACHE_SIZE = 1200
+
+
+@functools.lru_cache(maxsize=256)
+def _prepared(sql: str):
+    """Parse a raw SQL string into a TextClause once; repeated queries reuse it."""
+    return text(sql)
+
+
+def _get_engine(url: str):
+    engine = _engine_cache.get(url)
+    if engine is not None:
+        return engine
+    with _engine_lock:
+        engine = _engine_cache.get(url)
+        if engine is None:
+            if url.startswith("sqlite"):
+                # A file-backed SQLite connection is cheap to open; pooling only adds
+                # contention on a shared handle across threads
+                engine = create_engine(url, poolclass=NullPool,
+                                       connect_args={"check_same_thread": False},
+                                       query_cache_size=SQL_COMPILE_CACHE_SIZE)
+            else:
+                kwargs = {
+                    "pool_size": DB_POOL_SIZE,
+                    "max_overflow": DB_POOL_OVERFLOW,
+                    "pool_recycle": DB_POOL_RECYCLE,
+                }
+                if make_url(url).get_driver_name() == "psycopg2":
+                    # Page executemany() of UPDATE/DELETE through execute_batch as well as INSERTs
+                    kwargs["executemany_mode"] = "values_plus_batch"
+                engine = create_engine(url, pool_pre_ping=True, pool_use_lifo=True,
+                                       query_cache_size=SQL_COMPILE_CACHE_SIZE, **kwargs)
+            _engine_cache[url] = engine
+    return engine
+
+
+def _temp_path(target: Path) -> Path:
+    return target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}{_TEMP_SUFFIX}")
+
+
+def _is_temp_file(name: str) -> bool:
+    """In-flight (or crash-orphaned) _write_if_changed() temp files are never listed."""
+    return name.startswith(".") and name.endswith(_TEMP_SUFFIX)
+
+
+def _walk_files(base: str, prefix: str = "") -> Iterator[str]:
+    """Yield paths (relative to base) of files under base whose name starts with prefix.
+
+    Uses os.scandir so is_dir()/is_file() come from the cached directory entry
+    type instead of a stat() and a Path object per entry, as rglob() does.
+    A directory part in prefix ("2024-01-15/app") anchors the walk at that
+    subdirectory, so the rest of the tree is never visited.
+    """
+    dir_part, _, prefix = prefix.rpartition("/")
+    start = os.path.join(base, dir_part) if dir_part else base
+    if not os.path.isdir(start):
+        return
+    stack = [start]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (entry.is_file(follow_symlinks=False) and entry.name.startswith(prefix)
+                        and not _is_temp_file(entry.name)):
+                    yield os.path.relpath(entry.path, base)
+
+
+class _IterReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buf) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(buf), len(self._pending))
+        buf[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def _payload_size(content: FileContent) -> Optional[int]:
+    """Byte length of an in-memory payload; None for streams and iterators."""
+    if isinstance(content, _BYTES_LIKE):
+        return memoryview(content).nbytes
+    return None
+
+
+def _as_stream(content: FileContent) -> BinaryIO:
+    if hasattr(content, "read"):
+        return content
+    if isinstance(content, _BYTES_LIKE):
+        return io.BytesIO(content)
+    return io.BufferedReader(_IterReader(content), buffer_size=STREAM_CHUNK_SIZE)
+
+
+def _write_if_changed(target: Path, content: FileContent) -> bool:
+    """Atomically replace target with content unless it already holds exactly that.
+
+    For in-memory payloads (bytes, bytearray, memoryview) the size is compared
+    first, so a changed file is usually detected without reading it; streams are
+    always written, chunk by chunk. Data goes to a temp file in the same
+    directory and is swapped in with os.replace(), so readers never see a
+    partial write. Returns whether a write happened.
+    """
+    size = _payload_size(content)
+    if size is not None:
+        try:
+            if target.stat().st_size == size and target.read_bytes() == content:
+                return False
+        except FileNotFoundError:
+            pass
+    tmp = _temp_path(target)
+    try:
+        with tmp.open("wb") as f:
+            if size is not None:
+                f.write(content)
+            else:
+                shutil.copyfileobj(_as_stream(content), f, STREAM_CHUNK_SIZE)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
 
 class BaseInfraAdapter:
     provider_name: str = "base"
@@ -33,9 +217,19 @@ class BaseInfraAdapter:
     def db_execute(self, query: str, params: dict = None) -> Any:
         raise NotImplementedError
 
-    def save_file(self, path: str, content: bytes, bucket: str = "default") -> str:
+    def db_execute_many(self, query: str, rows: List[dict]) -> Any:
         raise NotImplementedError
 
+    def save_file(self, path: str, content: FileContent, bucket: str = "default") -> str:
+        raise NotImplementedError
+
+    async def save_file_async(self, path: str, content: FileContent, bucket: str = "default") -> str:
+        """Non-blocking save_file(); the default runs the sync version in a worker thread."""
+        return await asyncio.to_thread(self.save_file, path, content, bucket)
+
+    async def aclose(self) -> None:
+        """Release async clients held for the running loop (called from app shutdown)."""
+
     def read_file(self, path: str, bucket: str = "default") -> Optional[bytes]:
         raise NotImplementedError
 
@@ -49,7 +243,25 @@ class BaseInfraAdapter:
         raise NotImplementedError
 
 
-class ReplitAdapter(BaseInfraAdapter):
+class _SQLAlchemyDBMixin:
+    """Shared db_execute() for adapters backed by a SQLAlchemy database URL."""
+
+    def _engine(self):
+        return _get_engine(self.get_database_url())
+
+    def db_execute(self, query: str, params: dict = None) -> Any:
+        with self._engine().begin() as conn:
+            return conn.execute(_prepared(query), params or {})
+
+    def db_execute_many(self, query: str, rows: List[dict]) -> Any:
+        """Run one statement for many parameter sets in a single transaction (executemany)."""
+        if not rows:
+            return None
+        with self._engine().begin() as conn:
+            return conn.execute(_prepared(query), rows)
+
+
+class ReplitAdapter(_SQLAlchemyDBMixin, BaseInfraAdapter):
     """Replit-native infrastructure: Managed PostgreSQL + local filesystem."""
 
     provider_name = "REPLIT"
@@ -58,56 +270,50 @@ class ReplitAdapter(BaseInfraAdapter):
         self._db_url = os.environ.get("DATABASE_URL", "")
         self._storage_root = Path(os.environ.get("REPLIT_STORAGE_PATH", "data"))
         self._storage_root.mkdir(parents=True, exist_ok=True)
+        # Inputs are fixed at construction, so the config dict is built once
+        self._config = {
+            "provider": self.provider_name,
+            "database": "Replit Managed PostgreSQL",
+            "storage": str(self._storage_root),
+            "db_connected": bool(self._db_url),
+        }
 
     def get_database_url(self) -> str:
         if not self._db_url:
             logger.warning("[INFRA:REPLIT] DATABASE_URL not set")
         return self._db_url
 
-    def db_execute(self, query: str, params: dict = None) -> Any:
-        from sqlalchemy import create_engine, text
-        engine = create_engine(self.get_database_url())
-        with engine.connect() as conn:
-            result = conn.execute(text(query), params or {})
-            conn.commit()
-            return result
-
-    def save_file(self, path: str, content: bytes, bucket: str = "default") -> str:
+    def save_file(self, path: str, content: FileContent, bucket: str = "default") -> str:
         target = self._storage_root / bucket / path
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(content)
-        logger.info(f"[INFRA:REPLIT] Saved file: {target}")
+        if _write_if_changed(target, content):
+            logger.info(f"[INFRA:REPLIT] Saved file: {target}")
         return str(target)
 
     def read_file(self, path: str, bucket: str = "default") -> Optional[bytes]:
-        target = self._storage_root / bucket / path
-        if target.exists():
-            return target.read_bytes()
-        return None
+        try:
+            return (self._storage_root / bucket / path).read_bytes()
+        except FileNotFoundError:
+            return None
 
     def delete_file(self, path: str, bucket: str = "default") -> bool:
-        target = self._storage_root / bucket / path
-        if target.exists():
-            target.unlink()
+        try:
+            (self._storage_root / bucket / path).unlink()
             return True
-        return False
+        except FileNotFoundError:
+            return False
 
     def list_files(self, prefix: str = "", bucket: str = "default") -> List[str]:
         base = self._storage_root / bucket
         if not base.exists():
             return []
-        return [str(p.relative_to(base)) for p in base.rglob(f"{prefix}*") if p.is_file()]
+        return list(_walk_files(str(base), prefix))
 
     def get_config(self) -> Dict[str, Any]:
-        return {
-            "provider": self.provider_name,
-            "database": "Replit Managed PostgreSQL",
-            "storage": str(self._storage_root),
-            "db_connected": bool(self._db_url),
-        }
+        return self._config
 
 
-class AWSAdapter(BaseInfraAdapter):
+class AWSAdapter(_SQLAlchemyDBMixin, BaseInfraAdapter):
     """AWS infrastructure: RDS PostgreSQL + S3. Requires boto3 + AWS credentials."""
 
     provider_name = "AWS"
@@ -116,44 +322,166 @@ class AWSAdapter(BaseInfraAdapter):
         self._db_url = os.environ.get("AWS_RDS_URL", os.environ.get("DATABASE_URL", ""))
         self._s3_bucket = os.environ.get("AWS_S3_BUCKET", "cybersentinel-storage")
         self._s3_region = os.environ.get("AWS_REGION", "us-east-1")
+        self._s3_accelerate = os.environ.get("AWS_S3_ACCELERATE", "false").lower() == "true"
+        # Pin the regional endpoint; transfer acceleration needs botocore to pick its own host
+        self._s3_endpoint = os.environ.get("AWS_S3_ENDPOINT") or (
+            None if self._s3_accelerate else f"https://s3.{self._s3_region}.amazonaws.com"
+        )
+        self._s3 = None
+        self._s3_lock = threading.Lock()
+        self._fallback: Optional["ReplitAdapter"] = None
+        self._async_session = aioboto3.Session() if aioboto3 is not None else None
+        # One aioboto3 client per event loop, opened on first use
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._config = {
+            "provider": self.provider_name,
+            "database": "Amazon RDS PostgreSQL",
+            "storage": f"s3://{self._s3_bucket}",
+            "region": self._s3_region,
+            "db_connected": bool(self._db_url),
+        }
 
     def get_database_url(self) -> str:
         return self._db_url
 
-    def db_execute(self, query: str, params: dict = None) -> Any:
-        from sqlalchemy import create_engine, text
-        engine = create_engine(self.get_database_url())
-        with engine.connect() as conn:
-            result = conn.execute(text(query), params or {})
-            conn.commit()
-            return result
-
-    def save_file(self, path: str, content: bytes, bucket: str = "default") -> str:
-        try:
-            import boto3
-            s3 = boto3.client("s3", region_name=self._s3_region)
-            key = f"{bucket}/{path}"
-            s3.put_object(Bucket=self._s3_bucket, Key=key, Body=content)
-            logger.info(f"[INFRA:AWS] Uploaded to S3: s3://{self._s3_bucket}/{key}")
-            return f"s3://{self._s3_bucket}/{key}"
-        except ImportError:
+    def _client_options(self) -> Dict[str, Any]:
+        """Client settings shared by the sync and aioboto3 S3 clients."""
+        return {
+            "s3": {
+                "use_accelerate_endpoint": self._s3_accelerate,
+                "addressing_style": "virtual",
+            },
+            "tcp_keepalive": True,
+            "max_pool_connections": 64,
+            "retries": {"max_attempts": 10, "mode": "adaptive"},
+        }
+
+    def _client(self):
+        """Build the S3 client once; botocore clients are thread-safe and pool connections."""
+        if self._s3 is None:
+            with self._s3_lock:
+                if self._s3 is None:
+                    self._s3 = boto3.client(
+                        "s3",
+                        region_name=self._s3_region,
+                        endpoint_url=self._s3_endpoint,
+                        config=BotoConfig(**self._client_options()),
+                    )
+        return self._s3
+
+    def _local_fallback(self) -> "ReplitAdapter":
+        if self._fallback is None:
+            self._fallback = ReplitAdapter()
+        return self._fallback
+
+    @staticmethod
+    def _transfer_config(threshold: int = S3_MULTIPART_THRESHOLD,
+                         chunksize: int = S3_MULTIPART_CHUNKSIZE,
+                         concurrency: int = S3_MAX_CONCURRENCY):
+        return TransferConfig(
+            multipart_threshold=threshold,
+            multipart_chunksize=chunksize,
+            max_concurrency=concurrency,
+            use_threads=True,
+        )
+
+    def save_file(self, path: str, content: FileContent, bucket: str = "default") -> str:
+        if boto3 is None:
             logger.error("[INFRA:AWS] boto3 not installed. Falling back to local storage.")
-            return ReplitAdapter().save_file(path, content, bucket)
+            return self._local_fallback().save_file(path, content, bucket)
+        s3 = self._client()
+        key = f"{bucket}/{path}"
+        size = _payload_size(content)
+        if size is not None and size < S3_MULTIPART_THRESHOLD:
+            s3.put_object(Bucket=self._s3_bucket, Key=key, Body=bytes(content))
+        else:
+            # Streams are read one part at a time, so memory stays near the chunk size
+            s3.upload_fileobj(_as_stream(content), self._s3_bucket, key,
+                              Config=self._transfer_config())
+        logger.info(f"[INFRA:AWS] Uploaded to S3: s3://{self._s3_bucket}/{key}")
+        return f"s3://{self._s3_bucket}/{key}"
+
+    async def _open_async_client(self):
+        context = self._async_session.client(
+            "s3",
+            region_name=self._s3_region,
+            endpoint_url=self._s3_endpoint,
+            config=AioConfig(**self._client_options()),
+        )
+        return context, await context.__aenter__()
+
+    async def _async_client(self):
+        """aioboto3 client for the running loop; concurrent first callers share one open."""
+        loop = asyncio.get_running_loop()
+        opening = self._async_clients.get(loop)
+        if opening is None:
+            opening = self._async_clients[loop] = loop.create_task(self._open_async_client())
+        try:
+            return (await opening)[1]
+        except Exception:
+            if self._async_clients.get(loop) is opening:
+                del self._async_clients[loop]
+            raise
+
+    async def aclose(self) -> None:
+        opening = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if opening is None:
+            return
+        try:
+            context, _ = await opening
+        except Exception:
+            return
+        await context.__aexit__(None, None, None)
+
+    async def save_file_async(self, path: str, content: FileContent, bucket: str = "default") -> str:
+        size = _payload_size(content)
+        if self._async_session is None or size is None or size >= S3_MULTIPART_THRESHOLD:
+            # No aioboto3, or a stream / large payload for the threaded multipart path
+            return await super().save_file_async(path, content, bucket)
+        key = f"{bucket}/{path}"
+        s3 = await self._async_client()
+        await s3.put_object(Bucket=self._s3_bucket, Key=key, Body=bytes(content))
+        logger.info(f"[INFRA:AWS] Uploaded to S3: s3://{self._s3_bucket}/{key}")
+        return f"s3://{self._s3_bucket}/{key}"
 
     def read_file(self, path: str, bucket: str = "default") -> Optional[bytes]:
         try:
-            import boto3
-            s3 = boto3.client("s3", region_name=self._s3_region)
+            s3 = self._client()
             key = f"{bucket}/{path}"
-            obj = s3.get_object(Bucket=self._s3_bucket, Key=key)
-            return obj["Body"].read()
-        except Exception:
+            # Ask for at most the first S3_DOWNLOAD_THRESHOLD bytes: small objects,
+            # the common case, arrive whole in this one GET and the body is
+            # always read to the end, so the pooled connection stays reusable
+            response = s3.get_object(Bucket=self._s3_bucket, Key=key,
+                                     Range=f"bytes=0-{S3_DOWNLOAD_THRESHOLD - 1}")
+            body = response["Body"]
+            try:
+                head = body.read()
+            finally:
+                body.close()
+            content_range = response.get("ContentRange")
+            total = int(content_range.rpartition("/")[2]) if content_range else len(head)
+            if len(head) >= total:
+                return head
+            # Larger objects go through the transfer manager as parallel ranged GETs
+            buf = io.BytesIO()
+            s3.download_fileobj(self._s3_bucket, key, buf,
+                                Config=self._transfer_config(
+                                    threshold=S3_DOWNLOAD_THRESHOLD,
+                                    chunksize=S3_DOWNLOAD_CHUNKSIZE,
+                                    concurrency=S3_DOWNLOAD_CONCURRENCY,
+                                ))
+            return buf.getvalue()
+        except Exception as e:
+            # A ranged GET on an empty object is answered with 416 InvalidRange
+            if getattr(e, "response", {}).get("Error", {}).get("Code") == "InvalidRange":
+                return b""
             return None
 
     def delete_file(self, path: str, bucket: str = "default") -> bool:
         try:
-            import boto3
-            s3 = boto3.client("s3", region_name=self._s3_region)
+            s3 = self._client()
             key = f"{bucket}/{path}"
             s3.delete_object(Bucket=self._s3_bucket, Key=key)
             return True
@@ -162,24 +490,22 @@ class AWSAdapter(BaseInfraAdapter):
 
     def list_files(self, prefix: str = "", bucket: str = "default") -> List[str]:
         try:
-            import boto3
-            s3 = boto3.client("s3", region_name=self._s3_region)
-            response = s3.list_objects_v2(Bucket=self._s3_bucket, Prefix=f"{bucket}/{prefix}")
-            return [obj["Key"] for obj in response.get("Contents", [])]
+            s3 = self._client()
+            # list_objects_v2 caps each response at 1000 keys; follow continuation tokens
+            pages = s3.get_paginator("list_objects_v2").paginate(
+                Bucket=self._s3_bucket,
+                Prefix=f"{bucket}/{prefix}",
+                PaginationConfig={"PageSize": 1000},
+            )
+            return [obj["Key"] for page in pages for obj in page.get("Contents", [])]
         except Exception:
             return []
 
     def get_config(self) -> Dict[str, Any]:
-        return {
-            "provider": self.provider_name,
-            "database": "Amazon RDS PostgreSQL",
-            "storage": f"s3://{self._s3_bucket}",
-            "region": self._s3_region,
-            "db_connected": bool(self._db_url),
-        }
+        return self._config
 
 
-class LocalAdapter(BaseInfraAdapter):
+class LocalAdapter(_SQLAlchemyDBMixin, BaseInfraAdapter):
     """Local development: SQLite + local filesystem."""
 
     provider_name = "LOCAL"
@@ -188,48 +514,43 @@ class LocalAdapter(BaseInfraAdapter):
         self._db_path = Path("data/local.db")
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._storage_root = Path("data")
+        self._config = {
+            "provider": self.provider_name,
+            "database": f"SQLite ({self._db_path})",
+            "storage": str(self._storage_root),
+            "db_connected": True,
+        }
 
     def get_database_url(self) -> str:
         return f"sqlite:///{self._db_path}"
 
-    def db_execute(self, query: str, params: dict = None) -> Any:
-        from sqlalchemy import create_engine, text
-        engine = create_engine(self.get_database_url())
-        with engine.connect() as conn:
-            result = conn.execute(text(query), params or {})
-            conn.commit()
-            return result
-
-    def save_file(self, path: str, content: bytes, bucket: str = "default") -> str:
+    def save_file(self, path: str, content: FileContent, bucket: str = "default") -> str:
         target = self._storage_root / bucket / path
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(content)
+        _write_if_changed(target, content)
         return str(target)
 
     def read_file(self, path: str, bucket: str = "default") -> Optional[bytes]:
-        target = self._storage_root / bucket / path
-        return target.read_bytes() if target.exists() else None
+        try:
+            return (self._storage_root / bucket / path).read_bytes()
+        except FileNotFoundError:
+            return None
 
     def delete_file(self, path: str, bucket: str = "default") -> bool:
-        target = self._storage_root / bucket / path
-        if target.exists():
-            target.unlink()
+        try:
+            (self._storage_root / bucket / path).unlink()
             return True
-        return False
+        except FileNotFoundError:
+            return False
 
     def list_files(self, prefix: str = "", bucket: str = "default") -> List[str]:
         base = self._storage_root / bucket
         if not base.exists():
             return []
-        return [str(p.relative_to(base)) for p in base.rglob(f"{prefix}*") if p.is_file()]
+        return list(_walk_files(str(base), prefix))
 
     def get_config(self) -> Dict[str, Any]:
-        return {
-            "provider": self.provider_name,
-            "database": f"SQLite ({self._db_path})",
-            "storage": str(self._storage_root),
-            "db_connected": True,
-        }
+        return self._config
 
 
 _ADAPTERS = {
@@ -246,4 +567,29 @@ def _create_adapter() -> BaseInfraAdapter:
     return adapter
 
 
-Infra: BaseInfraAdapter = _create_adapter()
+@functools.cache
+def get_infra() -> BaseInfraAdapter:
+    """Return the process-wide adapter, building it on first use."""
+    return _create_adapter()
+
+
+# Adapter methods importable straight from this module, e.g.
+# `from config.infra_adapter import db_execute`, bound to the active adapter
+_FORWARDED = frozenset({
+    "db_execute", "db_execute_many", "save_file", "save_file_async",
+    "read_file", "delete_file", "list_files", "get_config", "aclose",
+})
+
+
+def __getattr__(name: str):
+    # `Infra` and the forwarded methods are resolved lazily so importing this module
+    # does no filesystem or env setup. Once resolved they are stored as module
+    # globals, so later lookups never reach this hook again.
+    if name == "Infra":
+        value = get_infra()
+    elif name in _FORWARDED:
+        value = getattr(get_infra(), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
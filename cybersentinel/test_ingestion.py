@@ -17,19 +17,27 @@ SOP_GUIDELINES = {
     "LOW": "Action: Log event and continue monitoring."
 }
 
+MAX_CONCURRENT_ANALYSES = 8
 
-async def ai_soc_workflow(log_text, test_desc):
+
+def load_past_index(limit=10):
+    # ดึงเคสล่าสุดครั้งเดียวแล้วทำ index ตาม raw_log เพื่อให้ค้นหาแบบ O(1) ต่อ log
+    past_cases = memory.get_recent_incidents(limit=limit)
+    return {c['raw_log']: c for c in past_cases}
+
+
+async def ai_soc_workflow(log_text, test_desc, past_index=None):
     print(f"🔍 [Analyzing]: {test_desc}")
     print(f"   📥 Log: {log_text}")
 
     # 1. ตรวจสอบใน Database (Simulate Search Memory)
     # ในระบบจริงจะใช้ memory.get_similar_cases(log_text)
     print(f"   🧠 Checking historical logs for similar patterns...")
-    past_cases = memory.get_recent_incidents(limit=10)
+    if past_index is None:
+        past_index = load_past_index()
 
     # จำลองการตรวจสอบความซ้ำของ IP หรือ Behavior
-    existing_case = next((c for c in past_cases if c['raw_log'] == log_text),
-                         None)
+    existing_case = past_index.get(log_text)
 
     # 2. กระบวนการตัดสินใจ (Self-Learning Logic)
     if existing_case:
@@ -101,8 +109,20 @@ async def run_test_cases():
         }
     ]
 
-    for case in test_logs:
-        analysis = await log_analyzer.analyze_log(case['log'])
+    # ยิงทุกเคสพร้อมกัน แต่จำกัดจำนวนที่รันพร้อมกันเพื่อไม่ให้โดน rate limit ของ API
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+
+    async def analyze(log_text):
+        async with semaphore:
+            return await log_analyzer.analyze_log(log_text)
+
+    results = await asyncio.gather(*(analyze(case['log']) for case in test_logs),
+                                   return_exceptions=True)
+
+    for case, analysis in zip(test_logs, results):
+        if isinstance(analysis, Exception):
+            print(f"❌ {case['desc']}: {analysis}")
+            continue
         print(f"✨ AI Result: {analysis['risk_level']}")
 
     print(f"\n✅ ALL AI SOC TEST CASES COMPLETED")